@@ -1,61 +1,354 @@
+import argparse
+import cProfile
+import hashlib
+import io
+import os
+import pickle
+import pstats
 import time
 import heapq
-from copy import deepcopy
+import random
+import tracemalloc
+from collections import OrderedDict, deque
+from itertools import combinations, islice
+
+
+def generar_tablero(num_cartas=36, tamano_grupo=2, semilla=None):
+    """
+    Genera un tablero aleatorio de num_cartas con grupos de tamano_grupo cartas iguales
+    (tamano_grupo=2 son parejas, 3 son tríos, ...). Cada valor aparece exactamente
+    tamano_grupo veces, que es lo que asumen ambos agentes.
+    """
+    if num_cartas % tamano_grupo != 0:
+        raise ValueError(f"{num_cartas} cartas no se pueden repartir en grupos de {tamano_grupo}")
+    tablero = [valor for valor in range(1, num_cartas // tamano_grupo + 1) for _ in range(tamano_grupo)]
+    random.Random(semilla).shuffle(tablero)
+    return tablero
+
+
+def unir_posiciones(posiciones):
+    """Formatea posiciones como '3 y 4' (pareja) o '1, 2 y 3' (trío)"""
+    return ", ".join(str(pos) for pos in posiciones[:-1]) + f" y {posiciones[-1]}"
+
+
+# ===== EVENTOS DE LAS JUGADAS =====
+# Los agentes no imprimen directamente cada jugada: emiten eventos estructurados
+# (tipo, posiciones, valor) a un receptor. Con verboso=True el receptor es
+# imprimir_evento; con verboso=False y sin receptor no se formatea ni se imprime nada.
+EVENTO_EXPLORAR = 'explorar'  # (EVENTO_EXPLORAR, (pos,), valor)
+EVENTO_EMPAREJAR = 'emparejar'  # (EVENTO_EMPAREJAR, (pos1, pos2, ...), valor)
+EVENTO_DESCUBRIR = 'descubrir'  # Grupo revelado y emparejado en el mismo movimiento
+
+
+def imprimir_evento(evento):
+    """Receptor por defecto: muestra el evento con los mensajes de siempre"""
+    tipo, posiciones, valor = evento
+    if tipo == EVENTO_EXPLORAR:
+        print(f"Explorando posición {posiciones[0]}, encontré valor {valor}")
+    elif tipo == EVENTO_EMPAREJAR:
+        print(f"Emparejando posiciones {unir_posiciones(posiciones)} (valor: {valor})")
+    elif tipo == EVENTO_DESCUBRIR:
+        print(f"¡Descubrí pareja inmediata! Posiciones {unir_posiciones(posiciones)} (valor: {valor})")
+
+
+def formatear_accion(accion, tablero):
+    """
+    Texto de una acción de A*. Las acciones son tuplas (tipo, posiciones) con los
+    mismos tipos que los eventos; el texto solo se arma cuando se va a mostrar.
+    """
+    tipo, posiciones = accion
+    if tipo == EVENTO_EMPAREJAR:
+        return f"Emparejar {'-'.join(str(pos) for pos in posiciones)} (valor: {tablero[posiciones[0]]})"
+    if tipo == EVENTO_DESCUBRIR:
+        return f"Descubrir y emparejar {'-'.join(str(pos) for pos in posiciones)} (valor: {tablero[posiciones[0]]})"
+    if len(posiciones) == 1:
+        return f"Explorar posición {posiciones[0]}"
+    return f"Explorar posiciones {','.join(str(pos) for pos in posiciones)}"
+
+
+def elegir_receptor(verboso, eventos):
+    """Receptor de eventos de un agente: el indicado, imprimir si es verboso, o ninguno"""
+    if eventos is not None:
+        return eventos
+    return imprimir_evento if verboso else None
+
+
+# ===== INSTRUMENTACIÓN OPCIONAL =====
+class Instrumentacion:
+    """
+    Estadísticas de una resolución: tiempo por fase, pico de la frontera,
+    asignaciones de memoria y, opcionalmente, un perfil de cProfile
+
+    Se activa entregando una instancia al agente (`instrumentacion=`); sin ella
+    los bucles solo pagan una comparación con None por fase. Fases de A*:
+    'sucesores', 'heuristica', 'frontera' (push/pop del heap) y 'duplicados'
+    (hash y consultas a explorados / mejor_g); A* anytime suma 'voraz' (sus
+    planes voraces). Fases del voraz: 'pareja' y 'revelar'. `asignaciones` usa tracemalloc y `perfil` cProfile; ambos
+    tienen costo propio, así que no se recomiendan para medir latencias.
+    """
+    def __init__(self, asignaciones=False, perfil=False):
+        self.asignaciones = asignaciones
+        self.perfil = perfil
+        self.tiempos_ns = {}  # {fase: nanosegundos acumulados}
+        self.llamadas = {}  # {fase: veces medida}
+        self.tiempo_total_ns = 0
+        self.pico_frontera = 0
+        self.bloques_asignados = None  # Bloques de memoria vivos creados durante la resolución
+        self.bytes_asignados = None
+        self.bytes_pico = None
+        self.sitios_asignacion = []  # [(archivo:línea, bloques, bytes)] de los que más asignaron
+        self.perfilador = None
+        self._inicio = None
+        self._foto_inicial = None
+        self._detener_tracemalloc = False
+
+    def sumar(self, fase, inicio_ns):
+        """Acumula el tiempo transcurrido desde inicio_ns en la fase indicada"""
+        self.tiempos_ns[fase] = self.tiempos_ns.get(fase, 0) + time.perf_counter_ns() - inicio_ns
+        self.llamadas[fase] = self.llamadas.get(fase, 0) + 1
+
+    def iniciar(self):
+        if self.asignaciones:
+            self._detener_tracemalloc = not tracemalloc.is_tracing()
+            if self._detener_tracemalloc:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._foto_inicial = tracemalloc.take_snapshot()
+        if self.perfil:
+            self.perfilador = cProfile.Profile()
+            self.perfilador.enable()
+        self._inicio = time.perf_counter_ns()
+
+    def detener(self):
+        self.tiempo_total_ns += time.perf_counter_ns() - self._inicio
+        if self.perfilador is not None:
+            self.perfilador.disable()
+        if self.asignaciones:
+            self.bytes_pico = tracemalloc.get_traced_memory()[1]
+            propias = [tracemalloc.Filter(False, tracemalloc.__file__)]  # Sin las asignaciones de tracemalloc
+            diferencias = (tracemalloc.take_snapshot().filter_traces(propias)
+                           .compare_to(self._foto_inicial.filter_traces(propias), 'lineno'))
+            self.bloques_asignados = sum(max(0, dif.count_diff) for dif in diferencias)
+            self.bytes_asignados = sum(max(0, dif.size_diff) for dif in diferencias)
+            self.sitios_asignacion = [(f"{dif.traceback[0].filename}:{dif.traceback[0].lineno}",
+                                       dif.count_diff, dif.size_diff) for dif in diferencias[:5]]
+            self._foto_inicial = None
+            if self._detener_tracemalloc:
+                tracemalloc.stop()
+
+    def resumen(self):
+        """Diccionario serializable con todas las medidas"""
+        return {
+            'tiempo_total_ns': self.tiempo_total_ns,
+            'tiempos_ns': dict(self.tiempos_ns),
+            'llamadas': dict(self.llamadas),
+            'pico_frontera': self.pico_frontera,
+            'bloques_asignados': self.bloques_asignados,
+            'bytes_asignados': self.bytes_asignados,
+            'bytes_pico': self.bytes_pico,
+            'sitios_asignacion': self.sitios_asignacion,
+        }
+
+    def texto_perfil(self, limite=15):
+        """Las `limite` funciones con más tiempo acumulado según cProfile"""
+        if self.perfilador is None:
+            return ""
+        salida = io.StringIO()
+        pstats.Stats(self.perfilador, stream=salida).sort_stats('cumulative').print_stats(limite)
+        return salida.getvalue()
+
+    def mostrar(self):
+        print(f"\nInstrumentación ({self.tiempo_total_ns / 1e6:.3f} ms en total):")
+        for fase, tiempo in sorted(self.tiempos_ns.items(), key=lambda item: -item[1]):
+            porcentaje = 100 * tiempo / self.tiempo_total_ns if self.tiempo_total_ns else 0
+            print(f"  {fase:<11} {tiempo / 1e6:>10.3f} ms  {porcentaje:>5.1f}%  ({self.llamadas[fase]} llamadas)")
+        print(f"  Pico de la frontera: {self.pico_frontera}")
+        if self.bloques_asignados is not None:
+            print(f"  Asignaciones: {self.bloques_asignados} bloques, {self.bytes_asignados / 1024:.1f} KB "
+                  f"(pico {self.bytes_pico / 1024:.1f} KB)")
+            for sitio, bloques, tamano in self.sitios_asignacion:
+                print(f"    {sitio}: {bloques} bloques, {tamano / 1024:.1f} KB")
+        if self.perfilador is not None:
+            print(self.texto_perfil())
+
+
+# ===== ÍNDICE INCREMENTAL DE PAREJAS =====
+class IndiceParejas:
+    """
+    Índice incremental de parejas conocidas, compartido por ambos agentes
+
+    Para cada valor guarda las posiciones vistas que aún no se emparejan, y una
+    cola con los valores cuya pareja (o grupo, si tamano_grupo > 2) ya está
+    completa en memoria. Revelar una carta o emparejar una pareja lo actualiza
+    en O(1), sin recorrer la memoria.
+
+    El agente voraz usa el índice mutable (revelar / siguiente_pareja / emparejar).
+    A* necesita una copia barata por estado, así que cada EstadoJuego guarda su
+    propia cola `listas` (tupla inmutable) y usa los métodos *_en del índice.
+    """
+    def __init__(self, tablero, tamano_grupo=2, con_companeras=False):
+        self.tablero = tablero
+        self.tamano_grupo = tamano_grupo
+        self.pendientes = {}  # {valor: [posiciones vistas sin emparejar]}
+        self.listas = deque()  # Valores con la pareja completa en memoria
+        
+        # Posiciones de cada valor en el tablero, para consultar parejas de un estado
+        self.posiciones_valor = {}
+        for pos, valor in enumerate(tablero):
+            self.posiciones_valor.setdefault(valor, []).append(pos)
+        # Las otras cartas del grupo de cada posición, solo para A* (con_companeras=True):
+        # O(cartas · tamano_grupo), en lugar de una máscara del largo del tablero por valor
+        self.companeras = None
+        if con_companeras:
+            self.companeras = [tuple(otra for otra in self.posiciones_valor[valor] if otra != pos)
+                               for pos, valor in enumerate(tablero)]
+    
+    def revelar(self, pos):
+        """Registra una carta vista y encola su valor si completa una pareja"""
+        valor = self.tablero[pos]
+        posiciones = self.pendientes.get(valor)
+        if posiciones is None:
+            posiciones = self.pendientes[valor] = [pos]
+        else:
+            posiciones.append(pos)
+        if len(posiciones) == self.tamano_grupo:  # Con tamano_grupo=1 ya la primera carta lo completa
+            self.listas.append(valor)
+        return valor
+    
+    def siguiente_pareja(self):
+        """Devuelve la próxima pareja conocida (pos1, pos2, ...) o None"""
+        if self.listas:
+            return tuple(self.pendientes[self.listas[0]])
+        return None
+    
+    def emparejar(self):
+        """Saca del índice la pareja devuelta por siguiente_pareja"""
+        del self.pendientes[self.listas.popleft()]
+    
+    def companeras_vistas(self, mascara_vistas, pos):
+        """Cuántas de las otras cartas del grupo de `pos` están marcadas en `mascara_vistas`"""
+        vistas = 0
+        for otra in self.companeras[pos]:
+            vistas += mascara_vistas >> otra & 1
+        return vistas
+    
+    def revelar_en(self, estado, pos):
+        """Revela una carta en un estado de A* y actualiza su cola de parejas y sus cartas ocultas parciales"""
+        vistas = self.companeras_vistas(estado.mascara_vistas, pos)
+        if vistas:
+            estado.ocultas_parciales -= 1  # Otra carta de un grupo ya empezado
+        else:
+            estado.ocultas_parciales += self.tamano_grupo - 1  # Primer carta vista: el resto del grupo queda pendiente
+        estado.revelar(pos)
+        if vistas + 1 == self.tamano_grupo:
+            estado.listas += (self.tablero[pos],)
+    
+    def pareja_en(self, estado):
+        """Próxima pareja conocida de un estado de A* o None"""
+        if estado.listas:
+            return tuple(self.posiciones_valor[estado.listas[0]])
+        return None
+    
+    def emparejar_en(self, estado, valor=None):
+        """Empareja en un estado de A* el grupo de `valor` (por defecto, el de pareja_en)"""
+        if valor is None or valor == estado.listas[0]:
+            valor = estado.listas[0]
+            estado.listas = estado.listas[1:]
+        else:
+            estado.listas = tuple(otro for otro in estado.listas if otro != valor)
+        for pos in self.posiciones_valor[valor]:
+            estado.emparejar(pos)
+
 
 # ===== ALGORITMO ORIGINAL (VORAZ) =====
 class AgenteMemorice:
-    """Algoritmo voraz original - toma decisiones inmediatas sin retroceder"""
-    def __init__(self, tablero):
+    """
+    Algoritmo voraz original - toma decisiones inmediatas sin retroceder
+
+    verboso=False desactiva toda la salida por pantalla; `eventos` es un receptor
+    opcional (por ejemplo lista.append) que recibe cada jugada como tupla.
+    `instrumentacion` es una Instrumentacion opcional que resolver() llena y devuelve.
+    """
+    INTERVALO_PLAZO = 64  # Movimientos entre revisiones del reloj cuando hay plazo
+
+    def __init__(self, tablero, tamano_grupo=2, verboso=True, eventos=None, instrumentacion=None):
         self.tablero = tablero
+        self.verboso = verboso
+        self.emitir = elegir_receptor(verboso, eventos)
+        self.instrumentacion = instrumentacion
+        self.num_cartas = len(tablero)
+        self.tamano_grupo = tamano_grupo  # Cartas iguales por grupo (2 = parejas)
         self.memoria = {}  # Para recordar cartas vistas {posicion: valor}
         self.emparejadas = set()  # Posiciones ya emparejadas
         self.movimientos = 0  # Contador de movimientos
+        self.indice = IndiceParejas(tablero, tamano_grupo)  # Parejas conocidas, actualizado en cada turno
+        self.siguiente_posicion = 0  # Se explora en orden: todo lo anterior ya está en memoria
+        self.plazo_agotado = False  # True si resolver() se cortó por su plazo
     
     def buscar_pareja_conocida(self):
-        # Crear un diccionario para agrupar posiciones por valor
-        valores_posiciones = {}
-        
-        # Agrupar posiciones no emparejadas por su valor
-        for pos, valor in self.memoria.items():
-            if pos not in self.emparejadas:  # Solo considerar cartas no emparejadas
-                if valor not in valores_posiciones:
-                    valores_posiciones[valor] = []
-                valores_posiciones[valor].append(pos)
-        
-        # Buscar valores que tengan al menos 2 posiciones
-        for valor, posiciones in valores_posiciones.items():
-            if len(posiciones) >= 2:  # Encontré una pareja
-                return (posiciones[0], posiciones[1])
-        
-        return None  # No encontré ninguna pareja
+        # El índice ya agrupa las posiciones no emparejadas por valor: consulta O(1)
+        return self.indice.siguiente_pareja()
 
-    def resolver(self):
-        print("=== ALGORITMO VORAZ (ORIGINAL) ===")
+    def resolver(self, plazo=None):
+        """
+        Juega hasta emparejar todo; plazo son los segundos máximos (None = sin
+        límite). Al agotarse se detiene con el juego incompleto y deja
+        plazo_agotado en True, como las búsquedas de AgentememoriceAstar.
+        """
+        if self.verboso:
+            print("=== ALGORITMO VORAZ (ORIGINAL) ===")
         inicio_tiempo = time.time()  # Iniciar cronómetro
+        self.plazo_agotado = False
+        limite = None if plazo is None else time.perf_counter() + plazo
+        emitir = self.emitir
+        instrumentacion = self.instrumentacion
+        if instrumentacion is not None:
+            instrumentacion.iniciar()
         
-        while len(self.emparejadas) < 36:
+        while len(self.emparejadas) < self.num_cartas:
+            if (limite is not None and self.movimientos % self.INTERVALO_PLAZO == 0
+                    and time.perf_counter() >= limite):
+                self.plazo_agotado = True
+                break
+            
             # 1. Buscar si ya conocemos alguna pareja
+            if instrumentacion is not None:
+                inicio_fase = time.perf_counter_ns()
             pareja = self.buscar_pareja_conocida()
+            if instrumentacion is not None:
+                instrumentacion.sumar('pareja', inicio_fase)
             
             if pareja:
                 # Si encontramos pareja conocida, emparejarla
-                pos1, pos2 = pareja
-                print(f"Emparejando posiciones {pos1} y {pos2} (valor: {self.tablero[pos1]})")
-                self.emparejadas.add(pos1)
-                self.emparejadas.add(pos2)
+                if emitir is not None:
+                    emitir((EVENTO_EMPAREJAR, pareja, self.tablero[pareja[0]]))
+                self.emparejadas.update(pareja)
+                self.indice.emparejar()
                 self.movimientos += 1
             else:
-                # Estrategia: explorar 2 cartas por turno
-                cartas_exploradas = 0
-                for pos in range(36):
-                    if pos not in self.memoria and pos not in self.emparejadas and cartas_exploradas < 2:
-                        self.memoria[pos] = self.tablero[pos]
-                        print(f"Explorando posición {pos}, encontré valor {self.tablero[pos]}")
-                        cartas_exploradas += 1
+                # Estrategia: explorar tamano_grupo cartas por turno (2 con parejas)
+                if instrumentacion is not None:
+                    inicio_fase = time.perf_counter_ns()
+                fin = min(self.siguiente_posicion + self.tamano_grupo, self.num_cartas)
+                for pos in range(self.siguiente_posicion, fin):
+                    self.memoria[pos] = self.indice.revelar(pos)
+                    if emitir is not None:
+                        emitir((EVENTO_EXPLORAR, (pos,), self.tablero[pos]))
+                self.siguiente_posicion = fin
                 self.movimientos += 1
+                if instrumentacion is not None:
+                    instrumentacion.sumar('revelar', inicio_fase)
         
         tiempo_total = time.time() - inicio_tiempo
-        self.mostrar_estadisticas(tiempo_total, "Algoritmo Voraz")
+        if instrumentacion is not None:
+            instrumentacion.detener()
+        if self.verboso and self.plazo_agotado:
+            print(f"\nPlazo de {plazo} segundos agotado tras {self.movimientos} movimientos")
+        elif self.verboso:
+            self.mostrar_estadisticas(tiempo_total, "Algoritmo Voraz")
+            if instrumentacion is not None:
+                instrumentacion.mostrar()
+        return instrumentacion
 
     def mostrar_estadisticas(self, tiempo, metodo):
         print(f"\n=== JUEGO COMPLETADO CON {metodo} ===")
@@ -65,28 +358,90 @@ class AgenteMemorice:
 
 
 # ===== ALGORITMO A* (BÚSQUEDA INFORMADA) =====
+def posiciones_mascara(mascara):
+    """Recorre en orden creciente las posiciones marcadas en una máscara de bits"""
+    while mascara:
+        bit = mascara & -mascara
+        yield bit.bit_length() - 1
+        mascara ^= bit
+
+
+def mascara_posiciones(posiciones):
+    """Máscara de bits con las posiciones indicadas marcadas (inversa de posiciones_mascara)"""
+    mascara = 0
+    for pos in posiciones:
+        mascara |= 1 << pos
+    return mascara
+
+
 class EstadoJuego:
-    """Representa un estado del juego de memoria para A*"""
-    def __init__(self, memoria=None, emparejadas=None, movimientos=0):
-        self.memoria = memoria if memoria else {}
-        self.emparejadas = emparejadas if emparejadas else set()
+    """
+    Representa un estado del juego de memoria para A*
+
+    Estado compacto: las cartas vistas y emparejadas se guardan como máscaras
+    de bits (bit i = posición i), de modo que copiar, comparar y calcular el
+    hash son operaciones sobre enteros. Los valores revelados no se copian en
+    cada estado: se leen del tablero compartido a través de la máscara de vistas.
+    """
+    __slots__ = ('tablero', 'mascara_vistas', 'mascara_emparejadas', 'num_vistas', 'num_emparejadas',
+                 'listas', 'ocultas_parciales', 'huella', 'movimientos', 'g', 'h', 'f', 'padre', 'accion')
+
+    def __init__(self, tablero, mascara_vistas=0, mascara_emparejadas=0, movimientos=0,
+                 num_vistas=0, num_emparejadas=0, listas=(), huella=0, ocultas_parciales=0):
+        self.tablero = tablero  # Referencia compartida, nunca se copia
+        self.mascara_vistas = mascara_vistas  # Cartas en memoria
+        self.mascara_emparejadas = mascara_emparejadas  # Cartas ya emparejadas
+        self.num_vistas = num_vistas
+        self.num_emparejadas = num_emparejadas
+        self.listas = listas  # Valores con pareja conocida (cola del IndiceParejas)
+        self.ocultas_parciales = ocultas_parciales  # Cartas sin ver de grupos con alguna carta vista
+        self.huella = huella  # Huella de las cartas sin emparejar (solo con tabla de transposición)
         self.movimientos = movimientos
         self.g = movimientos  # Costo real desde el inicio
         self.h = 0  # Heurística (se calculará)
         self.f = 0  # Función de evaluación f = g + h
-    
+        self.padre = None  # Estado anterior, para reconstruir el camino al final
+        self.accion = None  # Acción (tipo, posiciones) que llevó desde el padre
+
+    @property
+    def memoria(self):
+        """Cartas vistas {posicion: valor}, construido bajo demanda (solo para mostrar)"""
+        return {pos: self.tablero[pos] for pos in posiciones_mascara(self.mascara_vistas)}
+
+    @property
+    def emparejadas(self):
+        """Posiciones emparejadas, construido bajo demanda (solo para mostrar)"""
+        return set(posiciones_mascara(self.mascara_emparejadas))
+
+    def revelar(self, pos):
+        """Marca una posición como vista"""
+        self.mascara_vistas |= 1 << pos
+        self.num_vistas += 1
+
+    def emparejar(self, pos):
+        """Marca una posición como emparejada"""
+        self.mascara_emparejadas |= 1 << pos
+        self.num_emparejadas += 1
+
+    def camino(self):
+        """Acciones desde el estado inicial, reconstruidas siguiendo los punteros al padre"""
+        acciones = []
+        estado = self
+        while estado.padre is not None:
+            acciones.append(estado.accion)
+            estado = estado.padre
+        acciones.reverse()
+        return acciones
+
     def es_estado_final(self):
         """Verifica si el juego está completado"""
-        return len(self.emparejadas) >= 36
+        return self.num_emparejadas >= len(self.tablero)
     
     def copia(self):
-        """Crea una copia profunda del estado"""
-        nuevo_estado = EstadoJuego(
-            memoria=deepcopy(self.memoria),
-            emparejadas=deepcopy(self.emparejadas),
-            movimientos=self.movimientos
-        )
-        return nuevo_estado
+        """Crea una copia del estado (solo copia enteros, O(1))"""
+        return EstadoJuego(self.tablero, self.mascara_vistas, self.mascara_emparejadas, self.movimientos,
+                           self.num_vistas, self.num_emparejadas, self.listas, self.huella,
+                           self.ocultas_parciales)
     
     def __lt__(self, other):
         """Comparador para la cola de prioridad"""
@@ -94,207 +449,910 @@ class EstadoJuego:
     
     def __eq__(self, other):
         """Igualdad basada en el estado del juego"""
-        return (self.memoria == other.memoria and 
-                self.emparejadas == other.emparejadas)
+        return (self.mascara_vistas == other.mascara_vistas and
+                self.mascara_emparejadas == other.mascara_emparejadas)
     
     def __hash__(self):
         """Hash para usar en conjuntos"""
-        return hash((frozenset(self.memoria.items()), frozenset(self.emparejadas)))
+        return hash((self.mascara_vistas, self.mascara_emparejadas))
+
+def huella_carta(pos, valor, contexto):
+    """
+    Entero pseudoaleatorio de 64 bits para una carta (posición, valor). Es estable
+    entre procesos y reinicios, así las claves de una tabla guardada en disco
+    siguen siendo válidas al cargarla.
+    """
+    datos = repr((pos, valor, contexto)).encode()
+    return int.from_bytes(hashlib.blake2b(datos, digest_size=8).digest(), 'little')
+
+
+# ===== TABLA DE TRANSPOSICIÓN =====
+class TablaTransposicion:
+    """
+    Tabla LRU de sub-estados resueltos, compartida entre resoluciones
+
+    Clave: codificación canónica de un estado de A* (cartas vistas, cartas
+    emparejadas y una huella XOR de los valores sin emparejar, de modo que
+    tableros distintos que coinciden en esa parte comparten entradas).
+    Valor: (costo_restante, acciones_restantes) de la mejor solución conocida
+    desde ese estado. Con `capacidad` entradas como máximo se desaloja la
+    menos usada recientemente. `ruta` permite guardar y recargar la tabla
+    (formato pickle: cargar solo archivos generados por uno mismo).
+    """
+    VERSION = 1
+
+    def __init__(self, capacidad=100_000, ruta=None):
+        self.capacidad = capacidad
+        self.ruta = ruta
+        self.entradas = OrderedDict()  # {clave: (costo_restante, acciones_restantes)}
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        if ruta is not None and os.path.exists(ruta):
+            self.cargar(ruta)
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def consultar(self, clave):
+        """Devuelve (costo_restante, acciones_restantes) o None"""
+        entrada = self.entradas.get(clave)
+        if entrada is None:
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        self.entradas.move_to_end(clave)
+        return entrada
+
+    def registrar(self, clave, costo, acciones):
+        """Guarda el costo restante de un estado si mejora al conocido"""
+        previa = self.entradas.get(clave)
+        if previa is None or costo < previa[0]:
+            self.entradas[clave] = (costo, acciones)
+        self.entradas.move_to_end(clave)
+        while len(self.entradas) > self.capacidad:
+            self.entradas.popitem(last=False)
+            self.desalojos += 1
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {
+            'entradas': len(self.entradas),
+            'capacidad': self.capacidad,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'desalojos': self.desalojos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+        }
+
+    def guardar(self, ruta=None):
+        """Guarda una instantánea en disco (escritura atómica)"""
+        ruta = ruta or self.ruta
+        temporal = f"{ruta}.tmp"
+        with open(temporal, 'wb') as archivo:
+            pickle.dump({'version': self.VERSION, 'entradas': list(self.entradas.items())},
+                        archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, ruta)
+
+    def cargar(self, ruta=None):
+        """Carga una instantánea guardada con guardar(); las entradas cargadas no cuentan como aciertos"""
+        with open(ruta or self.ruta, 'rb') as archivo:
+            datos = pickle.load(archivo)
+        if datos.get('version') != self.VERSION:
+            raise ValueError(f"Versión de tabla de transposición no soportada: {datos.get('version')}")
+        for clave, entrada in datos['entradas'][-self.capacidad:]:
+            self.entradas[clave] = entrada
+
 
 class AgentememoriceAstar:
-    """Algoritmo A* - búsqueda informada con heurística"""
-    def __init__(self, tablero):
+    """
+    Algoritmo A* - búsqueda informada con heurística
+
+    verboso y eventos funcionan igual que en AgenteMemorice. limite_ramificacion
+    es cuántas posiciones sin ver se consideran al explorar (None = todas).
+    transposiciones es una TablaTransposicion opcional que A* consulta y
+    alimenta; puede compartirse entre agentes para reutilizar sub-estados ya
+    resueltos en resoluciones anteriores. instrumentacion es una
+    Instrumentacion opcional que resolver_con_astar llena y devuelve en la solución.
+    """
+    INTERVALO_PLAZO = 64  # Expansiones entre revisiones del reloj cuando hay plazo
+    VENTANA_VORAZ = 6  # Posiciones sin ver que considera plan_voraz cuando no hay limite_ramificacion
+
+    def __init__(self, tablero, tamano_grupo=2, verboso=True, eventos=None, limite_ramificacion=6,
+                 transposiciones=None, instrumentacion=None):
         self.tablero = tablero
+        self.instrumentacion = instrumentacion
+        self.limite_ramificacion = limite_ramificacion
+        self.transposiciones = transposiciones
+        self.huellas = None  # Huella de cada posición, solo si hay tabla de transposición
+        if transposiciones is not None:
+            contexto = (tamano_grupo, limite_ramificacion)
+            self.huellas = [huella_carta(pos, valor, contexto) for pos, valor in enumerate(tablero)]
+        self.verboso = verboso
+        self.emitir = elegir_receptor(verboso, eventos)
+        self.num_cartas = len(tablero)
+        self.tamano_grupo = tamano_grupo  # Cartas iguales por grupo (2 = parejas)
+        self.mascara_tablero = (1 << self.num_cartas) - 1
         self.solucion_encontrada = None
         self.nodos_explorados = 0
         self.nodos_expandidos = 0
+        self.duplicados_podados = 0  # Sucesores no insertados: ya estaban en la frontera con igual o menor g
+        self.pico_frontera = 0  # Tamaño máximo que alcanzó el heap
+        self.plazo_agotado = False  # True si la última búsqueda se cortó por su plazo
+        self.indice = IndiceParejas(tablero, tamano_grupo, con_companeras=True)  # Compartido por todos los estados
         
     def calcular_heuristica(self, estado):
         """
-        Heurística para A*: estima el número mínimo de movimientos restantes
-        
-        h(n) = (parejas_restantes / 2) + penalizacion_por_cartas_desconocidas
-        """
-        parejas_restantes = (36 - len(estado.emparejadas)) // 2
+        Heurística para A*: cota inferior de los movimientos restantes, en O(1)
         
-        # Contar parejas que ya conocemos en memoria
-        valores_conocidos = {}
-        for pos, valor in estado.memoria.items():
-            if pos not in estado.emparejadas:
-                valores_conocidos[valor] = valores_conocidos.get(valor, 0) + 1
+        h(n) = grupos_restantes + ceil(ocultas_parciales / tamano_grupo)
         
-        parejas_conocidas = sum(1 for count in valores_conocidos.values() if count >= 2)
-        
-        # Heurística: movimientos para emparejar conocidas + estimación para desconocidas
-        cartas_sin_descubrir = 36 - len(estado.memoria)
-        estimacion_descubrimiento = cartas_sin_descubrir // 2  # Optimista: 2 cartas por movimiento
-        
-        # Parejas restantes que no conocemos
-        parejas_desconocidas = parejas_restantes - parejas_conocidas
-        
-        return parejas_conocidas + max(0, parejas_desconocidas) + estimacion_descubrimiento
+        Cada movimiento empareja a lo más un grupo (emparejar o descubrir), así
+        que hacen falta grupos_restantes movimientos que emparejen. Las cartas
+        sin ver de grupos ya empezados no pueden salir con "descubrir" (que
+        revela un grupo completo sin ver): requieren exploraciones aparte, de a
+        lo más tamano_grupo cartas cada una. Es admisible y consistente: ningún
+        movimiento baja h en más de 1. ocultas_parciales se mantiene al revelar
+        (IndiceParejas.revelar_en), así que no se recorre la memoria.
+        """
+        return self.heuristica_conteos(estado.num_emparejadas, estado.ocultas_parciales)
+    
+    def heuristica_conteos(self, num_emparejadas, ocultas_parciales):
+        """calcular_heuristica a partir de los conteos, sin necesidad de un EstadoJuego"""
+        grupos_restantes = (self.num_cartas - num_emparejadas) // self.tamano_grupo
+        exploraciones = -(-ocultas_parciales // self.tamano_grupo)  # División hacia arriba
+        return grupos_restantes + exploraciones
     
     def buscar_pareja_conocida(self, estado):
         """Busca si existe una pareja conocida en la memoria del estado"""
-        valores_posiciones = {}
-        
-        for pos, valor in estado.memoria.items():
-            if pos not in estado.emparejadas:
-                if valor not in valores_posiciones:
-                    valores_posiciones[valor] = []
-                valores_posiciones[valor].append(pos)
+        return self.indice.pareja_en(estado)
+    
+    def crear_estado_inicial(self):
+        """Estado sin cartas vistas (con su huella si hay tabla de transposición)"""
+        estado = EstadoJuego(self.tablero)
+        if self.huellas is not None:
+            for huella in self.huellas:
+                estado.huella ^= huella
+        return estado
+    
+    def clave_transposicion(self, estado):
+        """Codificación canónica de un estado para la tabla de transposición"""
+        return (estado.mascara_vistas, estado.mascara_emparejadas, estado.huella)
+    
+    def aplicar_accion(self, estado, accion):
+        """Crea el sucesor de `estado` al ejecutar `accion` (tipo, posiciones)"""
+        nuevo_estado = estado.copia()
+        nuevo_estado.movimientos += 1
+        nuevo_estado.g = nuevo_estado.movimientos
+        nuevo_estado.padre = estado
+        nuevo_estado.accion = accion
         
-        for valor, posiciones in valores_posiciones.items():
-            if len(posiciones) >= 2:
-                return (posiciones[0], posiciones[1])
+        tipo, posiciones = accion
+        if tipo == EVENTO_EMPAREJAR:
+            self.indice.emparejar_en(nuevo_estado, self.tablero[posiciones[0]])
+        elif tipo == EVENTO_DESCUBRIR:
+            # Se empareja en el mismo movimiento: nunca entra a la cola del índice
+            for pos in posiciones:
+                nuevo_estado.revelar(pos)
+                nuevo_estado.emparejar(pos)
+        else:
+            for pos in posiciones:
+                self.indice.revelar_en(nuevo_estado, pos)
         
-        return None
+        if tipo != EVENTO_EXPLORAR:
+            nuevo_estado.huella = self.huella_tras(nuevo_estado.huella, posiciones)
+        return nuevo_estado
     
-    def generar_sucesores(self, estado):
-        """Genera todos los posibles estados sucesores"""
-        sucesores = []
+    def sucesores_diferidos(self, estado):
+        """
+        Generador de sucesores sin crear estados: entrega por cada acción
+        (accion, clave, num_emparejadas, ocultas_parciales, huella) del sucesor
+
+        clave es (mascara_vistas, mascara_emparejadas), la misma identidad que
+        EstadoJuego.__hash__. Todo se calcula en O(tamano_grupo) a partir de
+        `estado`, así A* decide si vale la pena guardar un sucesor (duplicados,
+        heurística) sin copiarlo; aplicar_accion lo materializa solo al sacarlo
+        de la frontera.
+        """
+        k = self.tamano_grupo
+        companeras = self.indice.companeras
+        vistas_padre = estado.mascara_vistas
+        emparejadas_padre = estado.mascara_emparejadas
         
         # Prioridad 1: Si hay parejas conocidas, emparejarlas
         pareja = self.buscar_pareja_conocida(estado)
         if pareja:
-            nuevo_estado = estado.copia()
-            pos1, pos2 = pareja
-            nuevo_estado.emparejadas.add(pos1)
-            nuevo_estado.emparejadas.add(pos2)
-            nuevo_estado.movimientos += 1
-            nuevo_estado.g = nuevo_estado.movimientos
-            sucesores.append((nuevo_estado, f"Emparejar {pos1}-{pos2} (valor: {self.tablero[pos1]})"))
-            return sucesores
+            mascara = mascara_posiciones(pareja)  # pareja son todas las posiciones del valor
+            yield ((EVENTO_EMPAREJAR, pareja), (vistas_padre, emparejadas_padre | mascara),
+                   estado.num_emparejadas + len(pareja), estado.ocultas_parciales,
+                   self.huella_tras(estado.huella, pareja))
+            return
         
         # Prioridad 2: Explorar nuevas cartas
-        posiciones_disponibles = [pos for pos in range(36) 
-                                if pos not in estado.memoria and pos not in estado.emparejadas]
-        
-        # Estrategia: explorar 2 cartas por movimiento (como el algoritmo original)
-        for i, pos1 in enumerate(posiciones_disponibles[:5]):  # Limitar para eficiencia
-            for pos2 in posiciones_disponibles[i+1:6]:
-                nuevo_estado = estado.copia()
-                nuevo_estado.memoria[pos1] = self.tablero[pos1]
-                nuevo_estado.memoria[pos2] = self.tablero[pos2]
-                nuevo_estado.movimientos += 1
-                nuevo_estado.g = nuevo_estado.movimientos
-                
-                # Bonificación heurística si descubrimos una pareja inmediatamente
-                if self.tablero[pos1] == self.tablero[pos2]:
-                    nuevo_estado.emparejadas.add(pos1)
-                    nuevo_estado.emparejadas.add(pos2)
-                    accion = f"Descubrir y emparejar {pos1}-{pos2} (valor: {self.tablero[pos1]})"
+        # Las emparejadas siempre están vistas: basta con las posiciones fuera de la máscara de vistas
+        libres = self.mascara_tablero & ~vistas_padre
+        posiciones_disponibles = list(islice(posiciones_mascara(libres), self.limite_ramificacion))  # Limitar para eficiencia
+        
+        # Estrategia: explorar tamano_grupo cartas por movimiento (como el algoritmo original)
+        # Si quedan menos, se exploran las que quedan
+        tamano = min(k, len(posiciones_disponibles))
+        for grupo in combinations(posiciones_disponibles, tamano):
+            valor = self.tablero[grupo[0]]
+            if tamano == k and all(self.tablero[pos] == valor for pos in grupo[1:]):
+                # Grupo completo descubierto: se empareja en el mismo movimiento
+                mascara = mascara_posiciones(grupo)
+                yield ((EVENTO_DESCUBRIR, grupo), (vistas_padre | mascara, emparejadas_padre | mascara),
+                       estado.num_emparejadas + k, estado.ocultas_parciales,
+                       self.huella_tras(estado.huella, grupo))
+                continue
+            
+            # Mismo conteo que IndiceParejas.revelar_en, carta por carta
+            vistas = vistas_padre
+            ocultas = estado.ocultas_parciales
+            for pos in grupo:
+                for otra in companeras[pos]:
+                    if vistas >> otra & 1:
+                        ocultas -= 1
+                        break
                 else:
-                    accion = f"Explorar posiciones {pos1},{pos2}"
-                
-                sucesores.append((nuevo_estado, accion))
-        
-        # También permitir explorar solo 1 carta si es necesario
-        if len(sucesores) == 0:
-            for pos in posiciones_disponibles[:3]:
-                nuevo_estado = estado.copia()
-                nuevo_estado.memoria[pos] = self.tablero[pos]
-                nuevo_estado.movimientos += 1
-                nuevo_estado.g = nuevo_estado.movimientos
-                sucesores.append((nuevo_estado, f"Explorar posición {pos}"))
-        
-        return sucesores
-    
-    def resolver_con_astar(self):
-        """Implementa el algoritmo A* para resolver el juego"""
-        print("=== ALGORITMO A* (BÚSQUEDA INFORMADA) ===")
+                    ocultas += k - 1
+                vistas |= 1 << pos
+            yield ((EVENTO_EXPLORAR, grupo), (vistas, emparejadas_padre), estado.num_emparejadas, ocultas,
+                   estado.huella)
+    
+    def generar_sucesores(self, estado):
+        """
+        Genera todos los posibles estados sucesores como pares (estado, accion)
+
+        Cada sucesor guarda un puntero a `estado` y su acción (tipo, posiciones),
+        así el camino se reconstruye solo al llegar a la meta. Materializa todo
+        lo que entrega sucesores_diferidos (lo usa IDA*, que recorre cada hijo).
+        """
+        return [(self.aplicar_accion(estado, accion), accion) for accion, *_ in self.sucesores_diferidos(estado)]
+    
+    def huella_tras(self, huella, posiciones):
+        """Huella de un estado tras emparejar `posiciones` (0 sin tabla de transposición)"""
+        if self.huellas is None:
+            return huella
+        for pos in posiciones:
+            huella ^= self.huellas[pos]
+        return huella
+    
+    def estimar_costo(self, clave, huella, heuristica, atajos):
+        """
+        h(n) para la búsqueda a partir de la clave (vistas, emparejadas) y la
+        huella de un estado: si ya se resolvió antes (tabla de transposición) se
+        usa su costo restante conocido y se anota en `atajos` el resto de la
+        solución; si no, `heuristica`, el valor de calcular_heuristica.
+        """
+        if self.transposiciones is not None:
+            entrada = self.transposiciones.consultar(clave + (huella,))
+            if entrada is not None:
+                atajos[clave] = entrada[1]
+                return entrada[0]
+        return heuristica
+    
+    def registrar_transposiciones(self, estado_final):
+        """Guarda en la tabla el costo restante de cada estado del camino de la solución"""
+        camino = estado_final.camino()
+        estado = estado_final
+        while estado is not None:
+            self.transposiciones.registrar(self.clave_transposicion(estado),
+                                           estado_final.g - estado.g, tuple(camino[estado.g:]))
+            estado = estado.padre
+    
+    def limite_plazo(self, plazo):
+        """Instante (time.perf_counter) en que vence un plazo en segundos, o None"""
+        self.plazo_agotado = False
+        return None if plazo is None else time.perf_counter() + plazo
+
+    def plazo_vencido(self, limite):
+        """Revisa el reloj cada INTERVALO_PLAZO expansiones, para no pagarlo en cada nodo"""
+        if self.nodos_expandidos % self.INTERVALO_PLAZO == 0 and time.perf_counter() >= limite:
+            self.plazo_agotado = True
+        return self.plazo_agotado
+
+    def detener_instrumentacion(self):
+        """Cierra la medición de la resolución en curso, si hay instrumentación"""
+        if self.instrumentacion is not None:
+            self.instrumentacion.pico_frontera = self.pico_frontera
+            self.instrumentacion.detener()
+
+    def resolver_con_astar(self, plazo=None):
+        """
+        Implementa el algoritmo A* para resolver el juego
+
+        La frontera guarda entradas livianas (f, counter, clave, padre, accion):
+        los sucesores se evalúan con sucesores_diferidos y solo se materializan
+        (aplicar_accion) al salir del heap, así los que nunca llegan al tope no
+        se copian. plazo son los segundos máximos de búsqueda (None = sin
+        límite): al agotarse devuelve None y deja plazo_agotado en True.
+        """
+        if self.verboso:
+            print("=== ALGORITMO A* (BÚSQUEDA INFORMADA) ===")
         inicio_tiempo = time.time()
+        limite = self.limite_plazo(plazo)
+        emitir = self.emitir
+        instrumentacion = self.instrumentacion
+        if instrumentacion is not None:
+            instrumentacion.iniciar()
         
         # Inicialización
-        estado_inicial = EstadoJuego()
-        estado_inicial.h = self.calcular_heuristica(estado_inicial)
+        atajos = {}  # Estados ya resueltos según la tabla de transposición: {clave: acciones restantes}
+        estado_inicial = self.crear_estado_inicial()
+        clave_inicial = (estado_inicial.mascara_vistas, estado_inicial.mascara_emparejadas)
+        estado_inicial.h = self.estimar_costo(clave_inicial, estado_inicial.huella,
+                                              self.calcular_heuristica(estado_inicial), atajos)
         estado_inicial.f = estado_inicial.g + estado_inicial.h
         
-        # Cola de prioridad (heap) para A*
-        frontera = [(estado_inicial.f, 0, estado_inicial, [])]  # (f, counter, estado, camino)
+        # Cola de prioridad (heap) para A*; accion None = estado ya materializado
+        frontera = [(estado_inicial.f, 0, clave_inicial, estado_inicial, None)]  # (f, counter, clave, padre, accion)
         counter = 1  # Para desempatar en el heap
         
-        # Conjunto de estados explorados
+        # Claves (vistas, emparejadas) de los estados explorados
         explorados = set()
+        # Índice de la frontera: mejor g con el que cada clave abierta está en el heap
+        mejor_g = {clave_inicial: estado_inicial.g}
         mejor_estado = None  # Para trackear el mejor estado encontrado
         
         while frontera:
-            f_actual, _, estado_actual, camino = heapq.heappop(frontera)
+            if instrumentacion is not None:
+                inicio_fase = time.perf_counter_ns()
+            f_actual, _, clave, padre, accion = heapq.heappop(frontera)
+            if instrumentacion is not None:
+                instrumentacion.sumar('frontera', inicio_fase)
+                inicio_fase = time.perf_counter_ns()
             
             self.nodos_explorados += 1
             
-            # Verificar si ya exploramos este estado
-            if estado_actual in explorados:
+            # Verificar si ya exploramos este estado (antes de materializarlo)
+            if clave in explorados:
+                if instrumentacion is not None:
+                    instrumentacion.sumar('duplicados', inicio_fase)
                 continue
                 
-            explorados.add(estado_actual)
+            explorados.add(clave)
+            mejor_g.pop(clave, None)  # Deja de estar abierto
+            if instrumentacion is not None:
+                instrumentacion.sumar('duplicados', inicio_fase)
+                inicio_fase = time.perf_counter_ns()
+            
+            # Materializar el estado: solo ahora se copia el padre y se aplica la acción
+            estado_actual = padre if accion is None else self.aplicar_accion(padre, accion)
+            estado_actual.f = f_actual
+            estado_actual.h = f_actual - estado_actual.g
+            if instrumentacion is not None:
+                instrumentacion.sumar('sucesores', inicio_fase)
+            
+            # Si la tabla ya conoce la solución desde aquí y es lo más barato de la frontera, se completa
+            if atajos and clave in atajos:
+                for accion in atajos[clave]:
+                    estado_actual = self.aplicar_accion(estado_actual, accion)
             
             # Actualizar el mejor estado (para mostrar progreso)
-            if mejor_estado is None or len(estado_actual.emparejadas) > len(mejor_estado.emparejadas):
+            if mejor_estado is None or estado_actual.num_emparejadas > mejor_estado.num_emparejadas:
                 mejor_estado = estado_actual
             
             # Verificar si alcanzamos el estado final
             if estado_actual.es_estado_final():
                 tiempo_total = time.time() - inicio_tiempo
+                self.detener_instrumentacion()
                 self.solucion_encontrada = {
                     'estado': estado_actual,
-                    'camino': camino,
+                    'camino': estado_actual.camino(),  # Lista de acciones (tipo, posiciones)
                     'nodos_explorados': self.nodos_explorados,
-                    'nodos_expandidos': self.nodos_expandidos
+                    'nodos_expandidos': self.nodos_expandidos,
+                    'duplicados_podados': self.duplicados_podados,
+                    'pico_frontera': self.pico_frontera,
+                    'instrumentacion': instrumentacion
                 }
-                self.mostrar_resultado(tiempo_total, "Algoritmo A*")
+                if self.transposiciones is not None:
+                    self.registrar_transposiciones(estado_actual)
+                if self.verboso:
+                    self.mostrar_resultado(tiempo_total, "Algoritmo A*")
                 return self.solucion_encontrada
             
-            # Expandir sucesores
-            self.nodos_expandidos += 1
-            sucesores = self.generar_sucesores(estado_actual)
+            if limite is not None and self.plazo_vencido(limite):
+                break
             
-            # Ejecutar la mejor acción encontrada (similar al voraz)
-            if sucesores:
-                mejor_sucesor, mejor_accion = sucesores[0]  # A* ya ordena por calidad
+            # Expandir sucesores de forma diferida: solo claves, conteos y heurística
+            self.nodos_expandidos += 1
+            g_sucesor = estado_actual.g + 1
+            sucesores = self.sucesores_diferidos(estado_actual)
+            primero = True
+            while True:
+                if instrumentacion is not None:
+                    inicio_fase = time.perf_counter_ns()
+                sucesor = next(sucesores, None)
+                if instrumentacion is not None:
+                    instrumentacion.sumar('sucesores', inicio_fase)
+                    inicio_fase = time.perf_counter_ns()
+                if sucesor is None:
+                    break
+                accion, clave, num_emparejadas, ocultas_parciales, huella = sucesor
                 
-                # Mostrar la acción elegida (similar al estilo voraz)
-                if "Emparejar" in mejor_accion:
-                    # Extraer posiciones del string de acción
-                    partes = mejor_accion.split()
-                    posiciones = partes[1].split('-')
-                    pos1, pos2 = int(posiciones[0]), int(posiciones[1])
-                    print(f"Emparejando posiciones {pos1} y {pos2} (valor: {self.tablero[pos1]})")
-                elif "Descubrir y emparejar" in mejor_accion:
-                    partes = mejor_accion.split()
-                    posiciones = partes[3].split('-')
-                    pos1, pos2 = int(posiciones[0]), int(posiciones[1])
-                    print(f"¡Descubrí pareja inmediata! Posiciones {pos1} y {pos2} (valor: {self.tablero[pos1]})")
-                elif "Explorar posiciones" in mejor_accion:
-                    # Extraer posiciones del string
-                    partes = mejor_accion.split()
-                    posiciones = partes[2].split(',')
-                    pos1, pos2 = int(posiciones[0]), int(posiciones[1])
-                    print(f"Explorando posición {pos1}, encontré valor {self.tablero[pos1]}")
-                    print(f"Explorando posición {pos2}, encontré valor {self.tablero[pos2]}")
-                elif "Explorar posición" in mejor_accion:
-                    partes = mejor_accion.split()
-                    pos = int(partes[2])
-                    print(f"Explorando posición {pos}, encontré valor {self.tablero[pos]}")
-            
-            # Añadir todos los sucesores a la frontera
-            for estado_sucesor, accion in sucesores:
-                if estado_sucesor not in explorados:
-                    # Calcular heurística y función de evaluación
-                    estado_sucesor.h = self.calcular_heuristica(estado_sucesor)
-                    estado_sucesor.f = estado_sucesor.g + estado_sucesor.h
+                # Ejecutar la mejor acción encontrada (similar al voraz)
+                if primero and emitir is not None:
+                    tipo, posiciones = accion  # La primera acción generada
                     
-                    nuevo_camino = camino + [accion]
-                    heapq.heappush(frontera, (estado_sucesor.f, counter, estado_sucesor, nuevo_camino))
-                    counter += 1
+                    # Emitir la acción elegida (similar al estilo voraz)
+                    if tipo == EVENTO_EXPLORAR:
+                        for pos in posiciones:
+                            emitir((EVENTO_EXPLORAR, (pos,), self.tablero[pos]))
+                    else:
+                        emitir((tipo, posiciones, self.tablero[posiciones[0]]))
+                primero = False
+                
+                # Añadir el sucesor a la frontera
+                if clave in explorados:
+                    if instrumentacion is not None:
+                        instrumentacion.sumar('duplicados', inicio_fase)
+                    continue
+                # Si ya está en la frontera con un g igual o mejor, la nueva entrada sobra
+                g_previo = mejor_g.get(clave)
+                if g_previo is not None and g_previo <= g_sucesor:
+                    self.duplicados_podados += 1
+                    if instrumentacion is not None:
+                        instrumentacion.sumar('duplicados', inicio_fase)
+                    continue
+                mejor_g[clave] = g_sucesor
+                if instrumentacion is not None:
+                    instrumentacion.sumar('duplicados', inicio_fase)
+                    inicio_fase = time.perf_counter_ns()
+                
+                # Calcular heurística y función de evaluación (O(1), desde los conteos)
+                h = self.estimar_costo(clave, huella, self.heuristica_conteos(num_emparejadas, ocultas_parciales),
+                                       atajos)
+                if instrumentacion is not None:
+                    instrumentacion.sumar('heuristica', inicio_fase)
+                    inicio_fase = time.perf_counter_ns()
+                
+                heapq.heappush(frontera, (g_sucesor + h, counter, clave, estado_actual, accion))
+                counter += 1
+                if instrumentacion is not None:
+                    instrumentacion.sumar('frontera', inicio_fase)
+            
+            if len(frontera) > self.pico_frontera:
+                self.pico_frontera = len(frontera)
         
         # No se encontró solución
         tiempo_total = time.time() - inicio_tiempo
-        print(f"\nNo se encontró solución")
-        print(f"Nodos explorados: {self.nodos_explorados}")
-        print(f"Tiempo transcurrido: {tiempo_total:.4f} segundos")
+        self.detener_instrumentacion()
+        if self.verboso and self.plazo_agotado:
+            print(f"\nPlazo de {plazo} segundos agotado sin solución")
+        elif self.verboso:
+            print(f"\nNo se encontró solución")
+            print(f"Nodos explorados: {self.nodos_explorados}")
+            print(f"Tiempo transcurrido: {tiempo_total:.4f} segundos")
         return None
     
+    def resolver_con_idastar(self, presupuesto_nodos=None, max_transposiciones=100_000, plazo=None):
+        """
+        IDA*: A* por profundización iterativa con memoria acotada
+
+        Usa la misma heurística y el mismo generador de sucesores que A*, pero en
+        lugar de frontera y conjunto de explorados hace búsquedas en profundidad
+        con un umbral de f que crece en cada iteración. Solo guarda el camino
+        actual, los hermanos pendientes de cada nivel y hasta
+        `max_transposiciones` estados ya visitados en la iteración (con su g),
+        para no repetir el subárbol de un estado al que se llega por otro orden
+        de jugadas: la memoria queda acotada sin importar cuántos nodos se
+        expandan. presupuesto_nodos limita el total de expansiones y plazo los
+        segundos de búsqueda, como en resolver_con_astar (None = sin límite).
+        """
+        if self.verboso:
+            print("=== ALGORITMO IDA* (MEMORIA ACOTADA) ===")
+        inicio_tiempo = time.time()
+        limite = self.limite_plazo(plazo)
+        instrumentacion = self.instrumentacion
+        if instrumentacion is not None:
+            instrumentacion.iniciar()
+        
+        estado_inicial = self.crear_estado_inicial()
+        estado_inicial.h = self.calcular_heuristica(estado_inicial)
+        estado_inicial.f = estado_inicial.g + estado_inicial.h
+        umbral = estado_inicial.f
+        iteraciones = 0
+        
+        while True:
+            iteraciones += 1
+            siguiente_umbral = float('inf')  # Menor f que superó el umbral actual
+            pila = [iter((estado_inicial,))]  # Un iterador de hermanos pendientes por nivel
+            retenidos = 1  # Estados en la pila aún sin visitar
+            visitados = {}  # {estado: menor g con que se expandió en esta iteración}
+            
+            while pila:
+                estado_actual = next(pila[-1], None)
+                if estado_actual is None:
+                    pila.pop()
+                    continue
+                
+                retenidos -= 1
+                self.nodos_explorados += 1
+                if estado_actual.f > umbral:
+                    siguiente_umbral = min(siguiente_umbral, estado_actual.f)
+                    continue
+                
+                # Con igual o menor g, su subárbol ya se recorrió con este umbral
+                g_previo = visitados.get(estado_actual)
+                if g_previo is not None and g_previo <= estado_actual.g:
+                    self.duplicados_podados += 1
+                    continue
+                if g_previo is not None or len(visitados) < max_transposiciones:
+                    visitados[estado_actual] = estado_actual.g
+                
+                if estado_actual.es_estado_final():
+                    tiempo_total = time.time() - inicio_tiempo
+                    self.detener_instrumentacion()
+                    self.solucion_encontrada = {
+                        'estado': estado_actual,
+                        'camino': estado_actual.camino(),
+                        'nodos_explorados': self.nodos_explorados,
+                        'nodos_expandidos': self.nodos_expandidos,
+                        'duplicados_podados': self.duplicados_podados,
+                        'pico_frontera': self.pico_frontera,
+                        'iteraciones': iteraciones,
+                        'instrumentacion': instrumentacion
+                    }
+                    if self.verboso:
+                        self.mostrar_resultado(tiempo_total, "Algoritmo IDA*")
+                    return self.solucion_encontrada
+                
+                if presupuesto_nodos is not None and self.nodos_expandidos >= presupuesto_nodos:
+                    self.detener_instrumentacion()
+                    if self.verboso:
+                        print(f"\nPresupuesto de {presupuesto_nodos} nodos agotado sin solución")
+                    return None
+                if limite is not None and self.plazo_vencido(limite):
+                    self.detener_instrumentacion()
+                    if self.verboso:
+                        print(f"\nPlazo de {plazo} segundos agotado sin solución")
+                    return None
+                
+                # Expandir: los hijos se recorren de menor a mayor f
+                self.nodos_expandidos += 1
+                if instrumentacion is not None:
+                    inicio_fase = time.perf_counter_ns()
+                sucesores = self.generar_sucesores(estado_actual)
+                if instrumentacion is not None:
+                    instrumentacion.sumar('sucesores', inicio_fase)
+                    inicio_fase = time.perf_counter_ns()
+                hijos = []
+                for estado_sucesor, _ in sucesores:
+                    estado_sucesor.h = self.calcular_heuristica(estado_sucesor)
+                    estado_sucesor.f = estado_sucesor.g + estado_sucesor.h
+                    hijos.append(estado_sucesor)
+                if instrumentacion is not None:
+                    instrumentacion.sumar('heuristica', inicio_fase)
+                hijos.sort(key=lambda estado: estado.f)
+                pila.append(iter(hijos))
+                
+                # En IDA* la "frontera" son los estados retenidos en la pila
+                retenidos += len(hijos)
+                if retenidos > self.pico_frontera:
+                    self.pico_frontera = retenidos
+            
+            if siguiente_umbral == float('inf'):
+                self.detener_instrumentacion()
+                if self.verboso:
+                    print(f"\nNo se encontró solución")
+                return None
+            umbral = siguiente_umbral
+    
+    def plan_voraz(self, estado, limite=None):
+        """
+        Acciones que completan `estado` tomando en cada paso el sucesor de menor
+        heurística de sucesores_diferidos (el primero generado si hay empate)
+
+        No crea un EstadoJuego por paso: simula el juego con conteos por valor y
+        una ventana con las limite_ramificacion primeras posiciones sin ver
+        (VENTANA_VORAZ si no hay límite, para no probar todas las combinaciones),
+        así que cuesta O(cartas) en tiempo y memoria. limite es un instante de
+        time.perf_counter (se revisa cada INTERVALO_PLAZO pasos): si vence antes
+        de terminar devuelve None y deja plazo_agotado en True.
+        """
+        k = self.tamano_grupo
+        tablero = self.tablero
+        num_cartas = self.num_cartas
+        posiciones_valor = self.indice.posiciones_valor
+        ancho_ventana = self.limite_ramificacion or self.VENTANA_VORAZ
+        
+        # Cartas vistas como bytes 0/1 (bit i de la máscara = posición i), en O(cartas)
+        bits = format(estado.mascara_vistas, 'b')[::-1].ljust(num_cartas, '0')
+        visto = bytearray(bits.encode().translate(bytes.maketrans(b'01', b'\x00\x01')))
+        vistas_valor = {}  # {valor: cartas vistas}
+        for pos in range(num_cartas):
+            if visto[pos]:
+                vistas_valor[tablero[pos]] = vistas_valor.get(tablero[pos], 0) + 1
+        
+        listas = deque(estado.listas)
+        num_emparejadas = estado.num_emparejadas
+        ocultas = estado.ocultas_parciales
+        ventana = []  # Primeras posiciones sin ver, en orden (las de sucesores_diferidos)
+        siguiente = 0
+        acciones = []
+        while num_emparejadas < num_cartas:
+            if limite is not None and len(acciones) % self.INTERVALO_PLAZO == 0 and time.perf_counter() >= limite:
+                self.plazo_agotado = True
+                return None
+            
+            # Con una pareja conocida, emparejarla es el único sucesor
+            if listas:
+                acciones.append((EVENTO_EMPAREJAR, tuple(posiciones_valor[listas.popleft()])))
+                num_emparejadas += k
+                continue
+            
+            while len(ventana) < ancho_ventana and siguiente < num_cartas:
+                if not visto[siguiente]:
+                    ventana.append(siguiente)
+                siguiente += 1
+            tamano = min(k, len(ventana))
+            mejor = None
+            for grupo in combinations(ventana, tamano):
+                valor = tablero[grupo[0]]
+                if tamano == k and all(tablero[pos] == valor for pos in grupo[1:]):
+                    h = self.heuristica_conteos(num_emparejadas + k, ocultas)
+                    descubre = True
+                else:
+                    # Mismo conteo que sucesores_diferidos, carta por carta
+                    ocultas_grupo = ocultas
+                    for indice, pos in enumerate(grupo):
+                        valor = tablero[pos]
+                        empezado = vistas_valor.get(valor) or any(tablero[otra] == valor for otra in grupo[:indice])
+                        ocultas_grupo += -1 if empezado else k - 1
+                    h = self.heuristica_conteos(num_emparejadas, ocultas_grupo)
+                    descubre = False
+                if mejor is None or h < mejor[0]:
+                    mejor = (h, grupo, descubre)
+            
+            _, grupo, descubre = mejor
+            for pos in grupo:
+                ventana.remove(pos)
+                visto[pos] = 1
+            if descubre:
+                acciones.append((EVENTO_DESCUBRIR, grupo))
+                num_emparejadas += k
+                continue
+            acciones.append((EVENTO_EXPLORAR, grupo))
+            for pos in grupo:
+                valor = tablero[pos]
+                vistas = vistas_valor.get(valor, 0)
+                ocultas += -1 if vistas else k - 1
+                vistas_valor[valor] = vistas + 1
+                if vistas + 1 == k:
+                    listas.append(valor)
+        return acciones
+    
+    def plan_en_orden(self):
+        """
+        Acciones de la regla del agente voraz desde el inicio: explorar las
+        cartas en orden de a tamano_grupo y emparejar cada grupo apenas se
+        completa en memoria (o descubrirlo si sale entero en una exploración)
+
+        Son jugadas válidas de sucesores_diferidos (siempre las primeras
+        posiciones sin ver) y no se crea ningún estado: O(cartas), el plan
+        más barato de armar para tener uno completo desde el principio.
+        """
+        k = self.tamano_grupo
+        tablero = self.tablero
+        posiciones_valor = self.indice.posiciones_valor
+        vistas_valor = {}
+        acciones = []
+        for inicio in range(0, self.num_cartas, k):
+            grupo = tuple(range(inicio, min(inicio + k, self.num_cartas)))
+            valor = tablero[inicio]
+            if len(grupo) == k and all(tablero[pos] == valor for pos in grupo[1:]):
+                acciones.append((EVENTO_DESCUBRIR, grupo))
+                continue
+            acciones.append((EVENTO_EXPLORAR, grupo))
+            completos = []
+            for pos in grupo:
+                valor = tablero[pos]
+                vistas_valor[valor] = vistas_valor.get(valor, 0) + 1
+                if vistas_valor[valor] == k:
+                    completos.append(valor)
+            for valor in completos:
+                acciones.append((EVENTO_EMPAREJAR, tuple(posiciones_valor[valor])))
+        return acciones
+    
+    def estado_completo(self, movimientos):
+        """Estado final (todo visto y emparejado) tras `movimientos`, sin su cadena de padres"""
+        return EstadoJuego(self.tablero, self.mascara_tablero, self.mascara_tablero, movimientos,
+                           self.num_cartas, self.num_cartas)
+    
+    def busqueda_ponderada(self, peso, cota_superior, limite=None, presupuesto_nodos=None):
+        """
+        Una pasada de A* ponderado (f = g + peso · h) para resolver_anytime
+        
+        Misma frontera diferida que resolver_con_astar, sin eventos ni tabla de
+        transposición, y se descarta todo sucesor con g + h >= cota_superior
+        (no puede mejorar el plan vigente). Devuelve (estado_final, mejor_estado,
+        completa, cota): estado_final es None si no hay plan más corto que
+        cota_superior, completa es False si la cortó el plazo o el presupuesto,
+        y con peso 1 cota es el último f expandido (cota inferior del óptimo).
+        """
+        instrumentacion = self.instrumentacion
+        estado_inicial = self.crear_estado_inicial()
+        clave_inicial = (estado_inicial.mascara_vistas, estado_inicial.mascara_emparejadas)
+        frontera = [(peso * self.calcular_heuristica(estado_inicial), 0, clave_inicial, estado_inicial, None)]
+        counter = 1
+        explorados = set()
+        mejor_g = {clave_inicial: estado_inicial.g}
+        mejor_estado = estado_inicial
+        cota = 0
+        
+        while frontera:
+            if instrumentacion is not None:
+                inicio_fase = time.perf_counter_ns()
+            _, _, clave, padre, accion = heapq.heappop(frontera)
+            if instrumentacion is not None:
+                instrumentacion.sumar('frontera', inicio_fase)
+                inicio_fase = time.perf_counter_ns()
+            self.nodos_explorados += 1
+            if clave in explorados:
+                if instrumentacion is not None:
+                    instrumentacion.sumar('duplicados', inicio_fase)
+                continue
+            explorados.add(clave)
+            mejor_g.pop(clave, None)
+            if instrumentacion is not None:
+                instrumentacion.sumar('duplicados', inicio_fase)
+                inicio_fase = time.perf_counter_ns()
+            
+            estado_actual = padre if accion is None else self.aplicar_accion(padre, accion)
+            if instrumentacion is not None:
+                instrumentacion.sumar('sucesores', inicio_fase)
+                inicio_fase = time.perf_counter_ns()
+            estado_actual.h = self.calcular_heuristica(estado_actual)
+            estado_actual.f = estado_actual.g + estado_actual.h
+            if instrumentacion is not None:
+                instrumentacion.sumar('heuristica', inicio_fase)
+            if estado_actual.f >= cota_superior:
+                continue  # Solo el estado inicial llega aquí: los sucesores se podan al generarlos
+            if peso == 1:
+                cota = estado_actual.f  # Con h consistente, f no decrece al expandir
+            if estado_actual.num_emparejadas > mejor_estado.num_emparejadas:
+                mejor_estado = estado_actual
+            if estado_actual.es_estado_final():
+                return estado_actual, mejor_estado, True, cota
+            
+            if presupuesto_nodos is not None and self.nodos_expandidos >= presupuesto_nodos:
+                return None, mejor_estado, False, cota
+            if limite is not None and self.plazo_vencido(limite):
+                return None, mejor_estado, False, cota
+            
+            self.nodos_expandidos += 1
+            g_sucesor = estado_actual.g + 1
+            sucesores = self.sucesores_diferidos(estado_actual)
+            while True:
+                if instrumentacion is not None:
+                    inicio_fase = time.perf_counter_ns()
+                sucesor = next(sucesores, None)
+                if instrumentacion is not None:
+                    instrumentacion.sumar('sucesores', inicio_fase)
+                    inicio_fase = time.perf_counter_ns()
+                if sucesor is None:
+                    break
+                accion, clave, num_emparejadas, ocultas_parciales, _ = sucesor
+                if clave in explorados:
+                    if instrumentacion is not None:
+                        instrumentacion.sumar('duplicados', inicio_fase)
+                    continue
+                if instrumentacion is not None:
+                    instrumentacion.sumar('duplicados', inicio_fase)
+                    inicio_fase = time.perf_counter_ns()
+                h = self.heuristica_conteos(num_emparejadas, ocultas_parciales)
+                if instrumentacion is not None:
+                    instrumentacion.sumar('heuristica', inicio_fase)
+                    inicio_fase = time.perf_counter_ns()
+                if g_sucesor + h >= cota_superior:
+                    continue  # No puede mejorar el plan vigente
+                g_previo = mejor_g.get(clave)
+                if g_previo is not None and g_previo <= g_sucesor:
+                    self.duplicados_podados += 1
+                    if instrumentacion is not None:
+                        instrumentacion.sumar('duplicados', inicio_fase)
+                    continue
+                mejor_g[clave] = g_sucesor
+                if instrumentacion is not None:
+                    instrumentacion.sumar('duplicados', inicio_fase)
+                    inicio_fase = time.perf_counter_ns()
+                heapq.heappush(frontera, (g_sucesor + peso * h, counter, clave, estado_actual, accion))
+                counter += 1
+                if instrumentacion is not None:
+                    instrumentacion.sumar('frontera', inicio_fase)
+            
+            if len(frontera) > self.pico_frontera:
+                self.pico_frontera = len(frontera)
+        
+        return None, mejor_estado, True, cota
+    
+    def resolver_anytime(self, plazo=None, presupuesto_nodos=None, pesos=(3.0, 2.0, 1.5, 1.25, 1.0)):
+        """
+        A* "anytime": siempre devuelve un plan completo, mejor cuanto más tiempo tenga
+        
+        Parte del mejor plan voraz que alcance a armar (plan_en_orden, y
+        plan_voraz si el plazo lo permite) y repite busqueda_ponderada con
+        cada peso de `pesos`, de mayor a menor, podando lo que no mejora el plan
+        vigente. Una pasada completa con peso w garantiza plan <= w · óptimo,
+        así que la cota inferior sube a ceil(plan / w); con peso 1 el plan
+        queda demostrado óptimo (dentro de limite_ramificacion). Si se agota
+        plazo (segundos) o presupuesto_nodos (expansiones), el estado más avanzado
+        de la pasada en curso se completa de forma voraz solo si aún queda plazo,
+        y se devuelve el mejor plan, con su cota inferior y la brecha
+        (movimientos - cota). Los planes voraces son listas de acciones, no
+        cadenas de estados: cuestan O(cartas) aun en tableros grandes.
+        """
+        if self.verboso:
+            print("=== A* ANYTIME (PONDERADO CON AJUSTE PROGRESIVO) ===")
+        inicio_tiempo = time.time()
+        limite = self.limite_plazo(plazo)
+        instrumentacion = self.instrumentacion
+        if instrumentacion is not None:
+            instrumentacion.iniciar()
+        
+        # Plan vigente: las acciones de `base` (su cadena de padres) seguidas de `acciones`
+        estado_inicial = self.crear_estado_inicial()
+        if instrumentacion is not None:
+            inicio_fase = time.perf_counter_ns()
+        base, acciones = estado_inicial, self.plan_en_orden()
+        voraz = self.plan_voraz(estado_inicial, limite)  # Suele ser mejor, pero solo si alcanza el plazo
+        if voraz is not None and len(voraz) < len(acciones):
+            acciones = voraz
+        if instrumentacion is not None:
+            instrumentacion.sumar('voraz', inicio_fase)
+        costo = len(acciones)
+        cota_inferior = self.calcular_heuristica(estado_inicial)
+        peso_garantizado = None  # Menor peso con pasada completa: plan <= peso · óptimo
+        iteraciones = 0
+        if self.verboso:
+            print(f"Plan voraz inicial: {costo} movimientos (cota inferior {cota_inferior})")
+        
+        for peso in pesos:
+            if cota_inferior >= costo:
+                break  # El plan vigente ya es óptimo
+            iteraciones += 1
+            final, mejor_estado, completa, cota = self.busqueda_ponderada(peso, costo, limite, presupuesto_nodos)
+            if final is not None:
+                base, acciones, costo = final, [], final.g
+            if not completa:
+                # Sin presupuesto: si queda plazo, el estado más avanzado de la pasada,
+                # terminado a lo voraz, puede mejorar el plan
+                cota_inferior = max(cota_inferior, cota)
+                if not self.plazo_agotado:
+                    if instrumentacion is not None:
+                        inicio_fase = time.perf_counter_ns()
+                    resto = self.plan_voraz(mejor_estado, limite)
+                    if instrumentacion is not None:
+                        instrumentacion.sumar('voraz', inicio_fase)
+                    if resto is not None and mejor_estado.g + len(resto) < costo:
+                        base, acciones, costo = mejor_estado, resto, mejor_estado.g + len(resto)
+                break
+            peso_garantizado = peso
+            cota_inferior = max(cota_inferior, int(-(-costo // peso)))  # División hacia arriba
+            if self.verboso:
+                print(f"  Peso {peso}: {costo} movimientos (cota inferior {cota_inferior})")
+        
+        tiempo_total = time.time() - inicio_tiempo
+        self.detener_instrumentacion()
+        self.solucion_encontrada = {
+            'estado': self.estado_completo(costo) if acciones else base,
+            'camino': base.camino() + acciones,
+            'nodos_explorados': self.nodos_explorados,
+            'nodos_expandidos': self.nodos_expandidos,
+            'duplicados_podados': self.duplicados_podados,
+            'pico_frontera': self.pico_frontera,
+            'iteraciones': iteraciones,
+            'peso': peso_garantizado,
+            'cota_inferior': cota_inferior,
+            'brecha': costo - cota_inferior,
+            'optimo': cota_inferior >= costo,
+            'instrumentacion': instrumentacion
+        }
+        if self.verboso:
+            self.mostrar_resultado(tiempo_total, "A* anytime")
+        return self.solucion_encontrada
+    
     def mostrar_resultado(self, tiempo, metodo):
         """Muestra las estadísticas del resultado"""
         if self.solucion_encontrada:
@@ -303,28 +1361,37 @@ class AgentememoriceAstar:
             print(f"Tiempo de resolución: {tiempo:.4f} segundos")
             print(f"Nodos explorados: {self.solucion_encontrada['nodos_explorados']}")
             print(f"Nodos expandidos: {self.solucion_encontrada['nodos_expandidos']}")
-            print(f"Cartas en memoria: {len(self.solucion_encontrada['estado'].memoria)}")
+            print(f"Duplicados podados: {self.solucion_encontrada['duplicados_podados']}")
+            print(f"Tamaño máximo de la frontera: {self.solucion_encontrada['pico_frontera']}")
+            print(f"Cartas en memoria: {self.solucion_encontrada['estado'].num_vistas}")
             print(f"Factor de ramificación efectivo: {self.solucion_encontrada['nodos_explorados'] / max(1, self.solucion_encontrada['nodos_expandidos']):.2f}")
+            if 'cota_inferior' in self.solucion_encontrada:
+                estado_cota = "óptimo" if self.solucion_encontrada['optimo'] else f"brecha {self.solucion_encontrada['brecha']}"
+                print(f"Cota inferior: {self.solucion_encontrada['cota_inferior']} ({estado_cota})")
             
             print(f"\nPrimeros pasos de la solución:")
             for i, accion in enumerate(self.solucion_encontrada['camino'][:8], 1):
-                print(f"  {i}. {accion}")
+                print(f"  {i}. {formatear_accion(accion, self.tablero)}")
             if len(self.solucion_encontrada['camino']) > 8:
                 print(f"  ... y {len(self.solucion_encontrada['camino']) - 8} pasos más")
+            if self.solucion_encontrada.get('instrumentacion') is not None:
+                self.solucion_encontrada['instrumentacion'].mostrar()
 
 
 # ===== CLASE COMPARADORA =====
 class ComparadorAlgoritmos:
     """Clase para comparar el rendimiento de ambos algoritmos"""
-    def __init__(self, tablero):
+    def __init__(self, tablero, tamano_grupo=2, pausas=True):
         self.tablero = tablero
+        self.tamano_grupo = tamano_grupo
+        self.pausas = pausas  # False para ejecutar sin esperar ENTER (ver benchmarkMemorice.py)
     
     def ejecutar_comparacion(self):
         print("="*70)
         print("COMPARACIÓN: ALGORITMO VORAZ vs A* - JUEGO DE MEMORIA")
         print("="*70)
         print(f"Tablero: {self.tablero}")
-        print(f"Dimensión: 6x6 = 36 cartas, 18 pares únicos")
+        print(f"Dimensión: {len(self.tablero)} cartas, {len(self.tablero) // self.tamano_grupo} grupos únicos de {self.tamano_grupo}")
         print("="*70)
         
         # ========== EJECUTAR ALGORITMO VORAZ ==========
@@ -332,7 +1399,7 @@ class ComparadorAlgoritmos:
         print("Iniciando algoritmo voraz (estrategia greedy)...")
         print("-" * 70)
         
-        agente_voraz = AgenteMemorice(self.tablero)
+        agente_voraz = AgenteMemorice(self.tablero, self.tamano_grupo)
         inicio_voraz = time.time()
         agente_voraz.resolver()
         tiempo_voraz = time.time() - inicio_voraz
@@ -343,7 +1410,8 @@ class ComparadorAlgoritmos:
         
         # Separador visual
         print("\n" * 2)
-        input("Presiona ENTER para continuar con A*...")
+        if self.pausas:
+            input("Presiona ENTER para continuar con A*...")
         print("\n")
         
         # ========== EJECUTAR ALGORITMO A* ==========
@@ -351,7 +1419,7 @@ class ComparadorAlgoritmos:
         print("Iniciando algoritmo A* (búsqueda informada con heurística)...")
         print("-" * 70)
         
-        agente_astar = AgentememoriceAstar(self.tablero)
+        agente_astar = AgentememoriceAstar(self.tablero, self.tamano_grupo)
         inicio_astar = time.time()
         resultado_astar = agente_astar.resolver_con_astar()
         tiempo_astar = time.time() - inicio_astar
@@ -362,7 +1430,8 @@ class ComparadorAlgoritmos:
         
         # ========== MOSTRAR COMPARACIÓN FINAL ==========
         print("\n" * 2)
-        input("Presiona ENTER para ver la comparación final...")
+        if self.pausas:
+            input("Presiona ENTER para ver la comparación final...")
         print("\n")
         
         print("📊 " + "="*23 + " COMPARACIÓN FINAL " + "="*23 + " 📊")
@@ -373,7 +1442,7 @@ class ComparadorAlgoritmos:
         print("-" * 70)
         print(f"{'Movimientos':<30} | {agente_voraz.movimientos:<15} | {resultado_astar['estado'].movimientos if resultado_astar else 'N/A':<15}")
         print(f"{'Tiempo (seg)':<30} | {tiempo_voraz:<15.4f} | {tiempo_astar:<15.4f}")
-        print(f"{'Cartas en memoria':<30} | {len(agente_voraz.memoria):<15} | {len(resultado_astar['estado'].memoria) if resultado_astar else 'N/A':<15}")
+        print(f"{'Cartas en memoria':<30} | {len(agente_voraz.memoria):<15} | {resultado_astar['estado'].num_vistas if resultado_astar else 'N/A':<15}")
         print(f"{'Nodos explorados':<30} | {'1 (directo)':<15} | {agente_astar.nodos_explorados:<15}")
         print(f"{'Nodos expandidos':<30} | {'1 (directo)':<15} | {agente_astar.nodos_expandidos:<15}")
         
@@ -441,19 +1510,23 @@ class ComparadorAlgoritmos:
                 'movimientos': resultado_astar['estado'].movimientos if resultado_astar else None,
                 'tiempo': tiempo_astar,
                 'nodos_explorados': agente_astar.nodos_explorados,
-                'memoria': len(resultado_astar['estado'].memoria) if resultado_astar else None
+                'memoria': resultado_astar['estado'].num_vistas if resultado_astar else None
             } if resultado_astar else None
         }
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Comparación Voraz vs A* en el juego de memoria")
+    parser.add_argument("--sin-pausas", action="store_true", help="no esperar ENTER entre etapas")
+    args = parser.parse_args()
+    
     # Tablero de ejemplo
     tablero_ejemplo = [1, 5, 2, 8, 1, 3, 7, 2, 9, 4, 6, 5, 
                       10, 3, 11, 7, 12, 4, 13, 8, 14, 6, 15, 9,
                       16, 10, 17, 11, 18, 12, 13, 14, 15, 16, 17, 18]
     
     # Ejecutar comparación
-    comparador = ComparadorAlgoritmos(tablero_ejemplo)
+    comparador = ComparadorAlgoritmos(tablero_ejemplo, pausas=not args.sin_pausas)
     resultados = comparador.ejecutar_comparacion()
     
     print("\n" + "="*70)
@@ -0,0 +1,345 @@
+import argparse
+import csv
+import json
+import math
+import os
+import statistics
+import time
+import tracemalloc
+
+from agenteMemorice import (AgenteMemorice, AgentememoriceAstar, Instrumentacion, TablaTransposicion,
+                            generar_tablero)
+from optimoMemorice import SolucionadorOptimo
+
+
+def percentil(valores, p):
+    """Percentil p (0-100) por rango más cercano sobre una lista ya ordenada"""
+    if not valores:
+        return None
+    rango = max(1, math.ceil(p / 100 * len(valores)))
+    return valores[rango - 1]
+
+
+def costos_exactos(agente):
+    """
+    Solución exhaustiva: costo restante óptimo h*(n) de cada estado alcanzable,
+    con los mismos sucesores que usa la búsqueda del agente. Solo para tableros chicos.
+    """
+    costos = {}
+
+    def costo(estado):
+        if estado not in costos:
+            if estado.es_estado_final():
+                costos[estado] = 0
+            else:
+                costos[estado] = 1 + min(costo(hijo) for hijo, _ in agente.generar_sucesores(estado))
+        return costos[estado]
+
+    costo(agente.crear_estado_inicial())
+    return costos
+
+
+def verificar_heuristica(num_tableros=50, num_cartas=8, tamano_grupo=2, semilla=0, limite_ramificacion=None):
+    """
+    Comprueba en tableros chicos que calcular_heuristica es admisible (h <= h*)
+    y consistente (h(n) <= 1 + h(n') para cada sucesor n') en todos los estados
+    alcanzables. Devuelve (estados revisados, lista de violaciones).
+    """
+    revisados = 0
+    violaciones = []
+    for num_tablero in range(num_tableros):
+        tablero = generar_tablero(num_cartas, tamano_grupo, semilla + num_tablero)
+        agente = AgentememoriceAstar(tablero, tamano_grupo, verboso=False, limite_ramificacion=limite_ramificacion)
+        for estado, exacto in costos_exactos(agente).items():
+            revisados += 1
+            h = agente.calcular_heuristica(estado)
+            if h > exacto:
+                violaciones.append((tablero, 'admisible', estado.mascara_vistas, estado.mascara_emparejadas, h, exacto))
+            if not estado.es_estado_final():
+                for hijo, accion in agente.generar_sucesores(estado):
+                    if h > 1 + agente.calcular_heuristica(hijo):
+                        violaciones.append((tablero, 'consistente', estado.mascara_vistas,
+                                            estado.mascara_emparejadas, accion))
+    return revisados, violaciones
+
+
+# ===== BENCHMARK SIN INTERACCIÓN =====
+class BenchmarkAlgoritmos:
+    """
+    Benchmark reproducible de ambos algoritmos sobre N tableros aleatorios con semilla
+
+    Cada tablero se resuelve con cada algoritmo midiendo la latencia con
+    time.perf_counter_ns, después de `calentamiento` ejecuciones descartadas.
+    La memoria pico se mide en una ejecución aparte con tracemalloc, para que
+    el rastreo de memoria no infle las latencias. Si se entrega una
+    TablaTransposicion, calentamiento, latencia y memoria se siguen midiendo
+    sin ella (el costo del solucionador), y cada tablero de A* se resuelve una
+    vez más con la tabla compartida: esos números, con caché, van aparte.
+    Con parejas, cada algoritmo se compara contra el óptimo exacto esperado
+    (SolucionadorOptimo); A* conoce el tablero, así que puede quedar bajo 1.0.
+    Ese óptimo cuenta turnos del juego clásico, no movimientos de los agentes:
+    ver mostrar_resumen.
+    """
+    ALGORITMOS = ('voraz', 'astar', 'idastar', 'anytime')
+
+    def __init__(self, num_tableros=20, num_cartas=36, tamano_grupo=2, semilla=0,
+                 calentamiento=2, algoritmos=('voraz', 'astar'), medir_memoria=True, transposiciones=None,
+                 plazo=None):
+        self.num_tableros = num_tableros
+        self.num_cartas = num_cartas
+        self.tamano_grupo = tamano_grupo
+        self.semilla = semilla  # El tablero i usa la semilla semilla + i
+        self.calentamiento = calentamiento
+        self.algoritmos = tuple(algoritmos)
+        self.medir_memoria = medir_memoria
+        self.transposiciones = transposiciones
+        self.plazo = plazo  # Segundos por resolución de A*, IDA* y anytime (None = sin límite)
+        self.ejecuciones = []  # Una fila por (tablero, algoritmo)
+
+    def configuracion(self):
+        return {
+            'num_tableros': self.num_tableros,
+            'num_cartas': self.num_cartas,
+            'tamano_grupo': self.tamano_grupo,
+            'semilla': self.semilla,
+            'calentamiento': self.calentamiento,
+            'algoritmos': list(self.algoritmos),
+            'plazo': self.plazo,
+        }
+
+    def optimo(self):
+        """Costo óptimo exacto esperado y de peor caso, o None si no son parejas"""
+        if self.tamano_grupo != 2:
+            return None
+        solucionador = SolucionadorOptimo(self.num_cartas, self.tamano_grupo)
+        return {
+            'movimientos_esperados': solucionador.costo_esperado(),
+            'movimientos_peor_caso': solucionador.costo_peor_caso(),
+        }
+
+    def _resolver(self, algoritmo, tablero, instrumentacion=None, transposiciones=None):
+        """
+        Resuelve un tablero y devuelve (movimientos, nodos_expandidos, pico_frontera)
+
+        La tabla de transposición solo se usa si se entrega aquí, para que las
+        mediciones del solucionador no repitan respuestas ya guardadas.
+        """
+        if algoritmo == 'voraz':
+            agente = AgenteMemorice(tablero, self.tamano_grupo, verboso=False, instrumentacion=instrumentacion)
+            agente.resolver()
+            return agente.movimientos, 0, 0
+        if algoritmo == 'anytime':
+            agente = AgentememoriceAstar(tablero, self.tamano_grupo, verboso=False, instrumentacion=instrumentacion)
+            resultado = agente.resolver_anytime(plazo=self.plazo)
+            return resultado['estado'].movimientos, agente.nodos_expandidos, agente.pico_frontera
+        if algoritmo in ('astar', 'idastar'):
+            agente = AgentememoriceAstar(tablero, self.tamano_grupo, verboso=False,
+                                         transposiciones=transposiciones, instrumentacion=instrumentacion)
+            if algoritmo == 'astar':
+                resultado = agente.resolver_con_astar(plazo=self.plazo)
+            else:
+                resultado = agente.resolver_con_idastar(plazo=self.plazo)
+            movimientos = resultado['estado'].movimientos if resultado else None
+            return movimientos, agente.nodos_expandidos, agente.pico_frontera
+        raise ValueError(f"Algoritmo desconocido: {algoritmo}")
+
+    def _memoria_pico(self, algoritmo, tablero):
+        """Bytes pico asignados durante una resolución (medido con tracemalloc)"""
+        tracemalloc.start()
+        try:
+            self._resolver(algoritmo, tablero)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def instrumentar(self, algoritmo, num_tablero=0, perfil=False):
+        """Resolución extra de un tablero con Instrumentacion (fases, asignaciones y perfil opcional)"""
+        instrumentacion = Instrumentacion(asignaciones=True, perfil=perfil)
+        tablero = generar_tablero(self.num_cartas, self.tamano_grupo, self.semilla + num_tablero)
+        self._resolver(algoritmo, tablero, instrumentacion)
+        return instrumentacion
+
+    def ejecutar(self):
+        """Ejecuta el benchmark completo y devuelve el resumen por algoritmo"""
+        tableros = [generar_tablero(self.num_cartas, self.tamano_grupo, self.semilla + i)
+                    for i in range(self.num_tableros)]
+        self.ejecuciones = []
+
+        for algoritmo in self.algoritmos:
+            for _ in range(self.calentamiento):
+                self._resolver(algoritmo, tableros[0])
+
+            for num_tablero, tablero in enumerate(tableros):
+                inicio = time.perf_counter_ns()
+                movimientos, nodos_expandidos, pico_frontera = self._resolver(algoritmo, tablero)
+                latencia = time.perf_counter_ns() - inicio
+
+                # Con tabla de transposición: una resolución más, medida aparte (caché caliente)
+                latencia_tabla = nodos_tabla = None
+                if self.transposiciones is not None and algoritmo == 'astar':
+                    inicio = time.perf_counter_ns()
+                    _, nodos_tabla, _ = self._resolver(algoritmo, tablero, transposiciones=self.transposiciones)
+                    latencia_tabla = time.perf_counter_ns() - inicio
+
+                self.ejecuciones.append({
+                    'tablero': num_tablero,
+                    'semilla': self.semilla + num_tablero,
+                    'algoritmo': algoritmo,
+                    'latencia_ns': latencia,
+                    'movimientos': movimientos,
+                    'nodos_expandidos': nodos_expandidos,
+                    'pico_frontera': pico_frontera,
+                    'memoria_pico_bytes': self._memoria_pico(algoritmo, tablero) if self.medir_memoria else None,
+                    'latencia_tabla_ns': latencia_tabla,
+                    'nodos_expandidos_tabla': nodos_tabla,
+                })
+
+        return self.resumen()
+
+    def resumen(self):
+        """Mediana/p95/p99 de latencia y promedios de movimientos, nodos, frontera y memoria por algoritmo"""
+        resumen = {}
+        optimo = self.optimo()
+        for algoritmo in self.algoritmos:
+            filas = [fila for fila in self.ejecuciones if fila['algoritmo'] == algoritmo]
+            if not filas:
+                continue
+            latencias = sorted(fila['latencia_ns'] for fila in filas)
+            movimientos = [fila['movimientos'] for fila in filas if fila['movimientos'] is not None]
+            memorias = [fila['memoria_pico_bytes'] for fila in filas if fila['memoria_pico_bytes'] is not None]
+            con_tabla = [fila for fila in filas if fila['latencia_tabla_ns'] is not None]
+            resumen[algoritmo] = {
+                'tableros': len(filas),
+                'resueltos': len(movimientos),
+                'latencia_mediana_ns': int(statistics.median(latencias)),
+                'latencia_p95_ns': percentil(latencias, 95),
+                'latencia_p99_ns': percentil(latencias, 99),
+                'movimientos_promedio': statistics.mean(movimientos) if movimientos else None,
+                # Movimientos de agente sobre turnos clásicos: ver la nota de mostrar_resumen
+                'relacion_optimo': (statistics.mean(movimientos) / optimo['movimientos_esperados']
+                                    if movimientos and optimo else None),
+                'nodos_expandidos_promedio': statistics.mean(fila['nodos_expandidos'] for fila in filas),
+                'pico_frontera_max': max(fila['pico_frontera'] for fila in filas),
+                'memoria_pico_max_bytes': max(memorias) if memorias else None,
+                'latencia_tabla_mediana_ns': (int(statistics.median(fila['latencia_tabla_ns'] for fila in con_tabla))
+                                              if con_tabla else None),
+                'nodos_expandidos_tabla_promedio': (statistics.mean(fila['nodos_expandidos_tabla'] for fila in con_tabla)
+                                                    if con_tabla else None),
+            }
+        return resumen
+
+    def guardar(self, ruta, formato=None):
+        """
+        Guarda los resultados en JSON (configuración + resumen + ejecuciones) o en
+        CSV (una fila por ejecución). El formato se deduce de la extensión si no se indica.
+        """
+        formato = formato or os.path.splitext(ruta)[1].lstrip('.').lower()
+        if formato == 'json':
+            with open(ruta, 'w', encoding='utf-8') as archivo:
+                json.dump({
+                    'configuracion': self.configuracion(),
+                    'optimo': self.optimo(),
+                    'resumen': self.resumen(),
+                    'ejecuciones': self.ejecuciones,
+                }, archivo, indent=2)
+        elif formato == 'csv':
+            with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+                columnas = ['tablero', 'semilla', 'algoritmo', 'latencia_ns', 'movimientos',
+                            'nodos_expandidos', 'pico_frontera', 'memoria_pico_bytes',
+                            'latencia_tabla_ns', 'nodos_expandidos_tabla']
+                escritor = csv.DictWriter(archivo, fieldnames=columnas)
+                escritor.writeheader()
+                escritor.writerows(self.ejecuciones)
+        else:
+            raise ValueError(f"Formato de salida no soportado: {formato}")
+
+    def mostrar_resumen(self):
+        """
+        Tabla por algoritmo. La columna "vs óptimo*" divide movimientos de agente
+        por turnos del óptimo clásico, que son modelos distintos: en el óptimo,
+        destapar una carta nueva y luego su compañera ya vista, o una pareja
+        completa, es un solo turno. Los agentes cuentan aparte la exploración y
+        el movimiento de emparejar, así que una pareja hallada al explorar cuesta
+        2. Con solo esos dos movimientos (los del voraz), todo agente que no
+        conoce el tablero necesita exactamente `cartas` movimientos (cartas / 2
+        exploraciones y cartas / 2 emparejamientos), y el voraz ya los logra.
+        A* además descubre y empareja en un movimiento cuando sabe dónde está
+        la pareja. Su relación por encima de 1.0
+        refleja el cambio de modelo, no una mala estrategia.
+        """
+        print(f"{'Algoritmo':<10} | {'Mediana (ms)':>12} | {'p95 (ms)':>10} | {'p99 (ms)':>10} | "
+              f"{'Movimientos':>11} | {'vs óptimo*':>10} | {'Nodos exp.':>10} | {'Frontera':>8} | {'Memoria (KB)':>12}")
+        print("-" * 116)
+        for algoritmo, datos in self.resumen().items():
+            movimientos = f"{datos['movimientos_promedio']:.2f}" if datos['movimientos_promedio'] is not None else 'N/A'
+            relacion = f"{datos['relacion_optimo']:.3f}" if datos['relacion_optimo'] is not None else 'N/A'
+            memoria = f"{datos['memoria_pico_max_bytes'] / 1024:.1f}" if datos['memoria_pico_max_bytes'] is not None else 'N/A'
+            print(f"{algoritmo:<10} | {datos['latencia_mediana_ns'] / 1e6:>12.3f} | "
+                  f"{datos['latencia_p95_ns'] / 1e6:>10.3f} | {datos['latencia_p99_ns'] / 1e6:>10.3f} | "
+                  f"{movimientos:>11} | {relacion:>10} | {datos['nodos_expandidos_promedio']:>10.1f} | "
+                  f"{datos['pico_frontera_max']:>8} | {memoria:>12}")
+        for algoritmo, datos in self.resumen().items():
+            if datos['latencia_tabla_mediana_ns'] is not None:
+                print(f"\n{algoritmo} con tabla de transposición (caché caliente, aparte de lo anterior): "
+                      f"mediana {datos['latencia_tabla_mediana_ns'] / 1e6:.3f} ms, "
+                      f"{datos['nodos_expandidos_tabla_promedio']:.1f} nodos expandidos en promedio")
+        optimo = self.optimo()
+        if optimo:
+            print(f"\n* Óptimo exacto sin conocer el tablero: {optimo['movimientos_esperados']:.3f} turnos "
+                  f"esperados, {optimo['movimientos_peor_caso']} en el peor caso. Cuenta turnos del juego "
+                  f"clásico: una pareja hallada en el mismo turno cuesta 1, mientras que los agentes cuentan "
+                  f"explorar + emparejar (2). Con los movimientos del voraz, sin conocer el tablero el "
+                  f"mínimo es {self.num_cartas}, y el voraz lo alcanza.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark sin interacción de Voraz y A*")
+    parser.add_argument("--tableros", type=int, default=20, help="cantidad de tableros aleatorios")
+    parser.add_argument("--cartas", type=int, default=36, help="cartas por tablero")
+    parser.add_argument("--grupo", type=int, default=2, help="cartas iguales por grupo (2 = parejas)")
+    parser.add_argument("--semilla", type=int, default=0, help="semilla del primer tablero")
+    parser.add_argument("--calentamiento", type=int, default=2, help="ejecuciones descartadas por algoritmo")
+    parser.add_argument("--algoritmos", nargs="+", choices=BenchmarkAlgoritmos.ALGORITMOS,
+                        default=['voraz', 'astar'])
+    parser.add_argument("--sin-memoria", action="store_true", help="no medir memoria pico con tracemalloc")
+    parser.add_argument("--salida", help="archivo .json o .csv donde guardar los resultados")
+    parser.add_argument("--transposiciones", type=int, default=0,
+                        help="capacidad de una tabla de transposición compartida por A* (0 = sin tabla)")
+    parser.add_argument("--transposiciones-ruta", help="archivo para cargar/guardar la tabla de transposición")
+    parser.add_argument("--plazo", type=float, default=None,
+                        help="segundos máximos por resolución de A*, IDA* y anytime (sin límite por defecto)")
+    parser.add_argument("--instrumentar", action="store_true",
+                        help="mostrar tiempo por fase y asignaciones de una resolución extra del primer tablero")
+    parser.add_argument("--perfil", action="store_true", help="con --instrumentar, incluir un perfil de cProfile")
+    parser.add_argument("--verificar-heuristica", type=int, metavar="CARTAS",
+                        help="solo comprobar la heurística contra la solución exhaustiva en tableros de CARTAS cartas")
+    args = parser.parse_args()
+
+    if args.verificar_heuristica:
+        for limite in (None, 6):
+            revisados, violaciones = verificar_heuristica(args.tableros, args.verificar_heuristica, args.grupo,
+                                                          args.semilla, limite)
+            print(f"Límite de ramificación {limite}: {revisados} estados revisados, {len(violaciones)} violaciones")
+            if violaciones:
+                raise SystemExit(f"Heurística no admisible o no consistente: {violaciones[0]}")
+        raise SystemExit(0)
+
+    tabla = None
+    if args.transposiciones > 0:
+        tabla = TablaTransposicion(args.transposiciones, args.transposiciones_ruta)
+    benchmark = BenchmarkAlgoritmos(args.tableros, args.cartas, args.grupo, args.semilla,
+                                    args.calentamiento, args.algoritmos, not args.sin_memoria, tabla,
+                                    args.plazo)
+    benchmark.ejecutar()
+    benchmark.mostrar_resumen()
+    if args.instrumentar:
+        for algoritmo in args.algoritmos:
+            print(f"\n--- {algoritmo} ---", end="")
+            benchmark.instrumentar(algoritmo, perfil=args.perfil).mostrar()
+    if tabla is not None:
+        print(f"\nTabla de transposición: {tabla.estadisticas()}")
+        if args.transposiciones_ruta:
+            tabla.guardar()
+    if args.salida:
+        benchmark.guardar(args.salida)
+        print(f"\nResultados guardados en {args.salida}")
@@ -0,0 +1,248 @@
+import argparse
+import array
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+
+from agenteMemorice import generar_tablero
+from loteMemorice import ALGORITMOS, ResolvedorLote
+
+# Formato binario empaquetado: cabecera fija y luego un registro de num_cartas
+# enteros sin signo little-endian de `ancho` bytes por tablero, sin separadores.
+MAGICO = b'MEMC'
+VERSION_BINARIO = 1
+CABECERA = struct.Struct('<4sBBI')  # (mágico, versión, ancho en bytes, cartas por tablero)
+CODIGOS_ANCHO = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}  # Tipo de array.array para cada ancho
+BYTES_LIBERACION = 1 << 20  # Cada cuánto se descartan las páginas del mmap ya leídas
+
+COLUMNAS_RESULTADO = ['indice', 'algoritmo', 'movimientos', 'memoria', 'tiempo_ns', 'nodos_explorados',
+                      'nodos_expandidos', 'duplicados_podados', 'pico_frontera', 'plazo_agotado',
+                      'cota_inferior', 'brecha', 'error']
+
+
+def detectar_formato(ruta, formato=None):
+    """Formato indicado o deducido de la extensión: 'jsonl', 'csv' o 'bin'"""
+    formato = formato or os.path.splitext(ruta)[1].lstrip('.').lower()
+    if formato == 'json':
+        formato = 'jsonl'
+    if formato not in ('jsonl', 'csv', 'bin'):
+        raise ValueError(f"Formato de tableros no soportado: {formato}")
+    return formato
+
+
+# ===== LECTURA EN FLUJO =====
+def leer_jsonl(ruta):
+    """
+    Un tablero por línea: una lista JSON o un objeto con la clave 'tablero'
+
+    Un objeto sin 'tablero' entrega None, que ResolvedorLote reporta como
+    tablero inválido sin cortar la lectura.
+    """
+    with open(ruta, encoding='utf-8') as archivo:
+        for linea in archivo:
+            if linea.strip():
+                datos = json.loads(linea)
+                yield datos.get('tablero') if isinstance(datos, dict) else datos
+
+
+def leer_csv(ruta):
+    """Un tablero por fila, valores enteros; se omite una fila de encabezado si la hay"""
+    with open(ruta, newline='', encoding='utf-8') as archivo:
+        for numero, fila in enumerate(csv.reader(archivo)):
+            if not fila:
+                continue
+            try:
+                yield [int(valor) for valor in fila]
+            except ValueError:
+                if numero == 0:
+                    continue  # Encabezado
+                raise
+
+
+def leer_binario(ruta):
+    """
+    Tableros de un archivo binario empaquetado, leídos con mmap
+
+    Las páginas ya leídas se descartan cada BYTES_LIBERACION bytes, así que la
+    memoria residente no depende del tamaño del archivo.
+    """
+    with open(ruta, 'rb') as archivo:
+        magico, version, ancho, num_cartas = CABECERA.unpack(archivo.read(CABECERA.size))
+        if magico != MAGICO or version != VERSION_BINARIO:
+            raise ValueError(f"{ruta} no es un archivo de tableros binario (versión {VERSION_BINARIO})")
+        if ancho not in CODIGOS_ANCHO:
+            raise ValueError(f"Ancho de valor no soportado: {ancho}")
+        tamano_registro = ancho * num_cartas
+        tamano_archivo = os.fstat(archivo.fileno()).st_size
+        if tamano_archivo == CABECERA.size or tamano_registro == 0:
+            return
+        if (tamano_archivo - CABECERA.size) % tamano_registro != 0:
+            raise ValueError(f"{ruta} está truncado: sobran bytes tras el último tablero")
+
+        with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            liberar = hasattr(mapa, 'madvise') and hasattr(mmap, 'MADV_DONTNEED')
+            if liberar:
+                mapa.madvise(mmap.MADV_SEQUENTIAL)
+            liberado = 0  # Bytes iniciales ya devueltos al sistema operativo (múltiplo de página)
+            codigo = CODIGOS_ANCHO[ancho]
+            for inicio in range(CABECERA.size, tamano_archivo, tamano_registro):
+                valores = array.array(codigo, mapa[inicio:inicio + tamano_registro])
+                if sys.byteorder == 'big':
+                    valores.byteswap()
+                yield valores.tolist()
+
+                # Las páginas ya leídas no se vuelven a usar: se descartan para no inflar la memoria residente
+                if liberar and inicio - liberado >= BYTES_LIBERACION:
+                    hasta = inicio - inicio % mmap.PAGESIZE
+                    mapa.madvise(mmap.MADV_DONTNEED, liberado, hasta - liberado)
+                    liberado = hasta
+
+
+def leer_tableros(ruta, formato=None):
+    """Generador de tableros de un archivo JSONL, CSV o binario (según la extensión)"""
+    lectores = {'jsonl': leer_jsonl, 'csv': leer_csv, 'bin': leer_binario}
+    return lectores[detectar_formato(ruta, formato)](ruta)
+
+
+# ===== ESCRITURA EN FLUJO =====
+def escribir_binario(ruta, tableros, ancho=2):
+    """
+    Escribe tableros en el formato binario empaquetado, sin cargarlos todos
+
+    Todos los tableros deben tener el mismo número de cartas (el del primero)
+    y valores enteros entre 0 y 2**(8*ancho) - 1. Devuelve cuántos se escribieron.
+    """
+    if ancho not in CODIGOS_ANCHO:
+        raise ValueError(f"Ancho de valor no soportado: {ancho}")
+    codigo = CODIGOS_ANCHO[ancho]
+    escritos = 0
+    num_cartas = None
+    with open(ruta, 'wb') as archivo:
+        for tablero in tableros:
+            if num_cartas is None:
+                num_cartas = len(tablero)
+                archivo.write(CABECERA.pack(MAGICO, VERSION_BINARIO, ancho, num_cartas))
+            elif len(tablero) != num_cartas:
+                raise ValueError(f"Tablero {escritos} con {len(tablero)} cartas; se esperaban {num_cartas}")
+            try:
+                valores = array.array(codigo, tablero)
+            except OverflowError:
+                raise ValueError(f"Tablero {escritos} tiene valores que no caben en {ancho} bytes") from None
+            if sys.byteorder == 'big':
+                valores.byteswap()
+            archivo.write(valores.tobytes())
+            escritos += 1
+        if num_cartas is None:
+            archivo.write(CABECERA.pack(MAGICO, VERSION_BINARIO, ancho, 0))
+    return escritos
+
+
+def escribir_tableros(ruta, tableros, formato=None, ancho=2):
+    """Escribe tableros en JSONL, CSV o binario (según la extensión) y devuelve cuántos"""
+    formato = detectar_formato(ruta, formato)
+    if formato == 'bin':
+        return escribir_binario(ruta, tableros, ancho)
+    escritos = 0
+    with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+        escritor = csv.writer(archivo) if formato == 'csv' else None
+        for tablero in tableros:
+            if escritor is not None:
+                escritor.writerow(tablero)
+            else:
+                archivo.write(json.dumps(list(tablero)) + '\n')
+            escritos += 1
+    return escritos
+
+
+class EscritorResultados:
+    """
+    Escribe resultados de resolver_tablero a medida que llegan, en JSONL o CSV
+
+    Se usa como administrador de contexto; cada escribir() va directo al
+    archivo, así que la memoria no crece con la cantidad de resultados.
+    """
+    def __init__(self, ruta, formato=None):
+        self.ruta = ruta
+        self.formato = detectar_formato(ruta, formato)
+        if self.formato == 'bin':
+            raise ValueError("Los resultados se escriben en JSONL o CSV")
+        self.archivo = None
+        self.escritor = None
+        self.escritos = 0
+
+    def __enter__(self):
+        self.archivo = open(self.ruta, 'w', newline='', encoding='utf-8')
+        if self.formato == 'csv':
+            self.escritor = csv.DictWriter(self.archivo, fieldnames=COLUMNAS_RESULTADO, extrasaction='ignore')
+            self.escritor.writeheader()
+        return self
+
+    def escribir(self, resultado):
+        if self.escritor is not None:
+            self.escritor.writerow(resultado)
+        else:
+            self.archivo.write(json.dumps(resultado) + '\n')
+        self.escritos += 1
+
+    def __exit__(self, *excepcion):
+        self.archivo.close()
+        self.archivo = None
+
+
+def resolver_archivo(entrada, salida, algoritmo='voraz', tamano_grupo=2, trabajadores=None,
+                     tamano_bloque=16, formato_entrada=None, formato_salida=None, plazo=None):
+    """
+    Resuelve todos los tableros de `entrada` y escribe un resultado por tablero en `salida`
+
+    Lectura, resolución (ResolvedorLote, con ventana de bloques pendientes) y
+    escritura trabajan en flujo: la memoria es constante aunque el archivo
+    tenga millones de tableros, y plazo (segundos por tablero) evita que un
+    tablero difícil detenga el archivo completo. Los tableros inválidos dan una
+    fila con 'error'. Devuelve cuántos tableros se procesaron.
+    """
+    resolvedor = ResolvedorLote(algoritmo, tamano_grupo, trabajadores, tamano_bloque, plazo=plazo)
+    with EscritorResultados(salida, formato_salida) as escritor:
+        for resultado in resolvedor.resolver(leer_tableros(entrada, formato_entrada)):
+            escritor.escribir(resultado)
+    return escritor.escritos
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lectura y resolución en flujo de archivos de tableros")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    generar = subcomandos.add_parser("generar", help="crear un archivo de tableros aleatorios")
+    generar.add_argument("salida", help="archivo .jsonl, .csv o .bin")
+    generar.add_argument("--tableros", type=int, default=1000, help="cantidad de tableros aleatorios")
+    generar.add_argument("--cartas", type=int, default=36, help="cartas por tablero")
+    generar.add_argument("--grupo", type=int, default=2, help="cartas iguales por grupo (2 = parejas)")
+    generar.add_argument("--semilla", type=int, default=0, help="semilla del primer tablero")
+    generar.add_argument("--ancho", type=int, choices=sorted(CODIGOS_ANCHO), default=2,
+                         help="bytes por valor en el formato binario")
+
+    resolver = subcomandos.add_parser("resolver", help="resolver cada tablero de un archivo")
+    resolver.add_argument("entrada", help="archivo .jsonl, .csv o .bin")
+    resolver.add_argument("salida", help="archivo .jsonl o .csv de resultados")
+    resolver.add_argument("--algoritmo", choices=ALGORITMOS, default='voraz')
+    resolver.add_argument("--grupo", type=int, default=2, help="cartas iguales por grupo (2 = parejas)")
+    resolver.add_argument("--trabajadores", type=int, default=None, help="procesos (por defecto, uno por núcleo)")
+    resolver.add_argument("--bloque", type=int, default=16, help="tableros por tarea enviada a un proceso")
+    resolver.add_argument("--plazo", type=float, default=None,
+                          help="segundos máximos por tablero (sin límite por defecto)")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    if args.comando == "generar":
+        tableros = (generar_tablero(args.cartas, args.grupo, args.semilla + i) for i in range(args.tableros))
+        cantidad = escribir_tableros(args.salida, tableros, ancho=args.ancho)
+        print(f"Tableros escritos: {cantidad} en {args.salida}")
+    else:
+        cantidad = resolver_archivo(args.entrada, args.salida, args.algoritmo, args.grupo,
+                                    args.trabajadores, args.bloque, plazo=args.plazo)
+        print(f"Tableros procesados: {cantidad}, resultados en {args.salida}")
+    tiempo = time.perf_counter() - inicio
+    print(f"Tiempo total: {tiempo:.3f} segundos ({cantidad / tiempo:.1f} tableros/segundo)")
@@ -0,0 +1,188 @@
+import argparse
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from agenteMemorice import AgenteMemorice, AgentememoriceAstar, generar_tablero
+
+ALGORITMOS = ('voraz', 'astar', 'idastar', 'anytime')
+
+
+def validar_tablero(tablero, tamano_grupo):
+    """
+    ValueError si el tablero no se reparte en grupos exactos de tamano_grupo
+
+    Un tablero así dejaría al voraz sin terminar nunca, así que se revisa antes
+    de resolver cualquier tablero que venga de fuera (archivos, servicio).
+    """
+    if not isinstance(tablero, (list, tuple)) or not tablero:
+        raise ValueError("Cada tablero debe ser una lista no vacía de valores")
+    try:
+        repeticiones = Counter(tablero)
+    except TypeError:
+        raise ValueError("Los valores del tablero deben ser números o textos") from None
+    if any(cantidad != tamano_grupo for cantidad in repeticiones.values()):
+        raise ValueError(f"Cada valor debe aparecer exactamente {tamano_grupo} veces")
+
+
+def resolver_tablero(tablero, algoritmo='voraz', tamano_grupo=2, plazo=None):
+    """
+    Resuelve un tablero con el algoritmo indicado y devuelve un resumen serializable
+
+    plazo (segundos) corta las resoluciones demasiado largas: el resultado
+    queda con movimientos None y plazo_agotado True. 'anytime' devuelve igual
+    el mejor plan hallado en el plazo, con su cota inferior y brecha.
+    """
+    inicio = time.perf_counter_ns()
+    if algoritmo == 'voraz':
+        agente = AgenteMemorice(tablero, tamano_grupo, verboso=False)
+        agente.resolver(plazo=plazo)
+        return {
+            'algoritmo': algoritmo,
+            'movimientos': None if agente.plazo_agotado else agente.movimientos,
+            'memoria': len(agente.memoria),
+            'plazo_agotado': agente.plazo_agotado,
+            'tiempo_ns': time.perf_counter_ns() - inicio,
+        }
+    if algoritmo in ('astar', 'idastar', 'anytime'):
+        agente = AgentememoriceAstar(tablero, tamano_grupo, verboso=False)
+        if algoritmo == 'astar':
+            resultado = agente.resolver_con_astar(plazo=plazo)
+        elif algoritmo == 'idastar':
+            resultado = agente.resolver_con_idastar(plazo=plazo)
+        else:
+            resultado = agente.resolver_anytime(plazo=plazo)
+        resumen = {
+            'algoritmo': algoritmo,
+            'movimientos': resultado['estado'].movimientos if resultado else None,
+            'memoria': resultado['estado'].num_vistas if resultado else None,
+            'nodos_explorados': agente.nodos_explorados,
+            'nodos_expandidos': agente.nodos_expandidos,
+            'duplicados_podados': agente.duplicados_podados,
+            'pico_frontera': agente.pico_frontera,
+            'plazo_agotado': agente.plazo_agotado,
+        }
+        if algoritmo == 'anytime':
+            resumen['cota_inferior'] = resultado['cota_inferior']
+            resumen['brecha'] = resultado['brecha']
+        resumen['tiempo_ns'] = time.perf_counter_ns() - inicio
+        return resumen
+    raise ValueError(f"Algoritmo desconocido: {algoritmo}")
+
+
+def _resolver_bloque(inicio, bloque, algoritmo, tamano_grupo, plazo=None):
+    """
+    Tarea de un proceso trabajador: resuelve un bloque de tableros consecutivos
+
+    Un tablero inválido no detiene el bloque: su resultado trae 'error' y
+    movimientos None. plazo son los segundos máximos por tablero.
+    """
+    resultados = []
+    for desplazamiento, tablero in enumerate(bloque):
+        try:
+            validar_tablero(tablero, tamano_grupo)
+        except ValueError as error:
+            resultado = {'algoritmo': algoritmo, 'movimientos': None, 'error': str(error)}
+        else:
+            resultado = resolver_tablero(tablero, algoritmo, tamano_grupo, plazo)
+        resultado['indice'] = inicio + desplazamiento
+        resultados.append(resultado)
+    return resultados
+
+
+# ===== RESOLUCIÓN EN PARALELO DE MUCHOS TABLEROS =====
+class ResolvedorLote:
+    """
+    Reparte la resolución de muchos tableros en un pool de procesos
+
+    Los tableros se envían en bloques de `tamano_bloque` para amortizar el costo
+    de comunicación entre procesos. El iterable de entrada se consume de a poco:
+    nunca hay más de `max_pendientes` bloques en vuelo, así que la memoria no
+    crece con el tamaño del lote. Cada tablero se valida antes de resolverlo
+    (validar_tablero): uno inválido da un resultado con 'error' y el resto
+    sigue. `plazo` son los segundos máximos por tablero (None = sin límite).
+    """
+    def __init__(self, algoritmo='voraz', tamano_grupo=2, trabajadores=None, tamano_bloque=16,
+                 max_pendientes=None, plazo=None):
+        if algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo desconocido: {algoritmo}")
+        self.algoritmo = algoritmo
+        self.tamano_grupo = tamano_grupo
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.tamano_bloque = tamano_bloque
+        self.max_pendientes = max_pendientes or 2 * self.trabajadores
+        self.plazo = plazo
+
+    def resolver(self, tableros, ordenado=True):
+        """
+        Resuelve todos los tableros y entrega los resultados a medida que están listos
+
+        Con ordenado=True los resultados salen en el orden de entrada; con
+        ordenado=False salen en el orden en que terminan los bloques. Cada
+        resultado incluye 'indice', la posición del tablero en la entrada.
+        """
+        tableros = iter(tableros)
+        siguiente_indice = 0
+
+        with ProcessPoolExecutor(max_workers=self.trabajadores) as pool:
+            def enviar_bloque():
+                nonlocal siguiente_indice
+                bloque = list(islice(tableros, self.tamano_bloque))
+                if not bloque:
+                    return None
+                futuro = pool.submit(_resolver_bloque, siguiente_indice, bloque,
+                                     self.algoritmo, self.tamano_grupo, self.plazo)
+                siguiente_indice += len(bloque)
+                return futuro
+
+            pendientes = deque()
+            for _ in range(self.max_pendientes):
+                futuro = enviar_bloque()
+                if futuro is None:
+                    break
+                pendientes.append(futuro)
+
+            while pendientes:
+                if ordenado:
+                    terminados = [pendientes.popleft()]
+                else:
+                    listos, _ = wait(pendientes, return_when=FIRST_COMPLETED)
+                    terminados = [futuro for futuro in pendientes if futuro in listos]
+                    for futuro in terminados:
+                        pendientes.remove(futuro)
+
+                for futuro in terminados:
+                    # Se repone el bloque antes de entregar resultados para no dejar trabajadores ociosos
+                    nuevo = enviar_bloque()
+                    if nuevo is not None:
+                        pendientes.append(nuevo)
+                    yield from futuro.result()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resolución en paralelo de muchos tableros aleatorios")
+    parser.add_argument("--tableros", type=int, default=1000, help="cantidad de tableros aleatorios")
+    parser.add_argument("--cartas", type=int, default=36, help="cartas por tablero")
+    parser.add_argument("--grupo", type=int, default=2, help="cartas iguales por grupo (2 = parejas)")
+    parser.add_argument("--semilla", type=int, default=0, help="semilla del primer tablero")
+    parser.add_argument("--algoritmo", choices=ALGORITMOS, default='voraz')
+    parser.add_argument("--trabajadores", type=int, default=None, help="procesos (por defecto, uno por núcleo)")
+    parser.add_argument("--bloque", type=int, default=16, help="tableros por tarea enviada a un proceso")
+    parser.add_argument("--desordenado", action="store_true", help="entregar resultados según terminan")
+    parser.add_argument("--plazo", type=float, default=None, help="segundos máximos por tablero (sin límite por defecto)")
+    args = parser.parse_args()
+
+    tableros = (generar_tablero(args.cartas, args.grupo, args.semilla + i) for i in range(args.tableros))
+    resolvedor = ResolvedorLote(args.algoritmo, args.grupo, args.trabajadores, args.bloque, plazo=args.plazo)
+
+    inicio = time.perf_counter()
+    movimientos = [resultado['movimientos'] for resultado in resolvedor.resolver(tableros, not args.desordenado)]
+    tiempo = time.perf_counter() - inicio
+
+    print(f"Tableros resueltos: {len(movimientos)} con {resolvedor.trabajadores} procesos")
+    print(f"Tiempo total: {tiempo:.3f} segundos ({len(movimientos) / tiempo:.1f} tableros/segundo)")
+    resueltos = [valor for valor in movimientos if valor is not None]
+    if resueltos:
+        print(f"Movimientos promedio: {sum(resueltos) / len(resueltos):.2f}")
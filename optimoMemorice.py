@@ -0,0 +1,185 @@
+import argparse
+import time
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # Opcional: sin NumPy se usa la versión en Python puro
+    np = None
+
+INFINITO = float('inf')
+
+
+@lru_cache(maxsize=32)
+def filas_optimas(cartas_sin_ver):
+    """
+    Costos óptimos (esperado, peor caso) para todos los estados con
+    `cartas_sin_ver` cartas ocultas, indexados por el número de sueltas
+
+    Programación dinámica de abajo hacia arriba sobre (u, s): u cartas sin ver
+    y s sueltas (valores con una carta vista y su pareja aún oculta). Entre las
+    u ocultas hay s compañeras de sueltas y (u - s) / 2 parejas nuevas, así que
+    u - s siempre es par. Cada turno da vuelta dos cartas: la primera es una
+    oculta cualquiera (por simetría da igual cuál). Si es compañera de una
+    suelta, se completa la pareja en el mismo turno. Si es nueva, la segunda
+    carta puede ser otra oculta o una suelta ya conocida (jugada "segura"),
+    según lo que convenga. Una pareja que queda conocida sin emparejar cuesta
+    exactamente un turno más, en cualquier momento, y se suma al instante.
+    Solo se guardan las dos filas anteriores: memoria O(u), tiempo O(u²).
+    Con NumPy cada fila se calcula como operaciones de arreglos sobre s
+    (_filas_numpy, mismos resultados); sin NumPy, en Python puro.
+    """
+    if np is not None:
+        return _filas_numpy(cartas_sin_ver)
+    esperado_2, peor_2 = None, None  # Fila u - 2
+    esperado_1, peor_1 = [0.0], [0]  # Fila u - 1 (empieza en u = 0: juego terminado)
+    if cartas_sin_ver == 0:
+        return tuple(esperado_1), tuple(peor_1)
+
+    for u in range(1, cartas_sin_ver + 1):
+        esperado = [INFINITO] * (u + 1)
+        peor = [INFINITO] * (u + 1)
+        for s in range(u % 2, u + 1, 2):
+            costo_esperado = 0.0
+            costo_peor = -INFINITO
+
+            # Primera carta compañera de una suelta (probabilidad s / u): pareja en este turno
+            if s > 0:
+                costo_esperado += s / u * (1 + esperado_1[s - 1])
+                costo_peor = max(costo_peor, 1 + peor_1[s - 1])
+
+            # Primera carta nueva (probabilidad (u - s) / u): elegir la segunda carta
+            if u - s > 0:
+                # a) Otra carta oculta
+                otras_nuevas = u - s - 2  # Cartas de parejas nuevas distintas a la de la primera
+                opcion_esperado = 1 / (u - 1) * (1 + esperado_2[s])
+                opcion_peor = 1 + peor_2[s]
+                if s > 0:  # Sale compañera de otra suelta: queda una pareja conocida (+1 turno)
+                    opcion_esperado += s / (u - 1) * (2 + esperado_2[s])
+                    opcion_peor = max(opcion_peor, 2 + peor_2[s])
+                if otras_nuevas > 0:  # Sale otra nueva: dos sueltas más
+                    opcion_esperado += otras_nuevas / (u - 1) * (1 + esperado_2[s + 2])
+                    opcion_peor = max(opcion_peor, 1 + peor_2[s + 2])
+
+                # b) Una suelta ya conocida: no se arriesga a revelar otra carta
+                if s > 0:
+                    opcion_esperado = min(opcion_esperado, 1 + esperado_1[s + 1])
+                    opcion_peor = min(opcion_peor, 1 + peor_1[s + 1])
+
+                costo_esperado += (u - s) / u * opcion_esperado
+                costo_peor = max(costo_peor, opcion_peor)
+
+            esperado[s] = costo_esperado
+            peor[s] = costo_peor
+        esperado_2, peor_2 = esperado_1, peor_1
+        esperado_1, peor_1 = esperado, peor
+
+    return tuple(esperado_1), tuple(peor_1)
+
+
+def _filas_numpy(cartas_sin_ver):
+    """
+    filas_optimas con cada fila u como operaciones de NumPy sobre todos los s
+
+    Las filas anteriores se rellenan con infinito para poder indexar s - 1,
+    s + 1 y s + 2 sin salirse; np.where descarta los casos que no aplican
+    (los mismos `if` de la versión en Python), en el mismo orden de sumas.
+    """
+    relleno = np.full(4, INFINITO)
+    esperado_2 = peor_2 = np.empty(0)  # Fila u - 2
+    esperado_1 = peor_1 = np.zeros(1)  # Fila u - 1 (empieza en u = 0: juego terminado)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for u in range(1, cartas_sin_ver + 1):
+            s = np.arange(u % 2, u + 1, 2)
+            e1, p1 = np.concatenate((esperado_1, relleno)), np.concatenate((peor_1, relleno))
+            e2, p2 = np.concatenate((esperado_2, relleno)), np.concatenate((peor_2, relleno))
+            hay_sueltas = s > 0
+            hay_nuevas = u - s > 0
+            otras_nuevas = u - s - 2
+            divisor = max(u - 1, 1)
+
+            # Primera carta compañera de una suelta: pareja en este turno
+            costo_esperado = np.where(hay_sueltas, s / u * (1 + e1[s - 1]), 0.0)
+            costo_peor = np.where(hay_sueltas, 1 + p1[s - 1], -INFINITO)
+
+            # Primera carta nueva: a) otra carta oculta
+            opcion_esperado = 1 / divisor * (1 + e2[s])
+            opcion_peor = 1 + p2[s]
+            opcion_esperado = np.where(hay_sueltas, opcion_esperado + s / divisor * (2 + e2[s]), opcion_esperado)
+            opcion_peor = np.where(hay_sueltas, np.maximum(opcion_peor, 2 + p2[s]), opcion_peor)
+            opcion_esperado = np.where(otras_nuevas > 0,
+                                       opcion_esperado + otras_nuevas / divisor * (1 + e2[s + 2]), opcion_esperado)
+            opcion_peor = np.where(otras_nuevas > 0, np.maximum(opcion_peor, 1 + p2[s + 2]), opcion_peor)
+
+            # b) Una suelta ya conocida
+            opcion_esperado = np.where(hay_sueltas, np.minimum(opcion_esperado, 1 + e1[s + 1]), opcion_esperado)
+            opcion_peor = np.where(hay_sueltas, np.minimum(opcion_peor, 1 + p1[s + 1]), opcion_peor)
+
+            costo_esperado = np.where(hay_nuevas, costo_esperado + (u - s) / u * opcion_esperado, costo_esperado)
+            costo_peor = np.where(hay_nuevas, np.maximum(costo_peor, opcion_peor), costo_peor)
+
+            esperado = np.full(u + 1, INFINITO)
+            peor = np.full(u + 1, INFINITO)
+            esperado[s] = costo_esperado
+            peor[s] = costo_peor
+            esperado_2, peor_2 = esperado_1, peor_1
+            esperado_1, peor_1 = esperado, peor
+
+    peor = tuple(int(costo) if costo != INFINITO else INFINITO for costo in peor_1.tolist())
+    return tuple(esperado_1.tolist()), peor
+
+
+# ===== SOLUCIÓN ÓPTIMA EXACTA (PROGRAMACIÓN DINÁMICA) =====
+class SolucionadorOptimo:
+    """
+    Costo óptimo exacto del juego de memoria para un jugador que no conoce el tablero
+
+    El juego óptimo depende solo de conteos (cartas sin ver y sueltas), no de
+    la posición de cada carta, así que una programación dinámica sobre esos
+    conteos da el número de movimientos esperado y el de peor caso de la mejor
+    estrategia, para cualquier tamaño de tablero. Sirve de referencia para
+    puntuar a los agentes: AgenteMemorice juega sin conocer el tablero, en
+    cambio A* lee el tablero al generar sucesores (es clarividente), por lo
+    que puede quedar por debajo del óptimo esperado.
+    Los costos son turnos del juego clásico (ver filas_optimas): completar una
+    pareja dentro del turno que la descubre cuesta 1. Los agentes cuentan
+    aparte la exploración y el movimiento de emparejar, así que la relación
+    que da `puntuar` mezcla ambos modelos.
+    Solo está definido para parejas (tamano_grupo=2).
+    """
+    def __init__(self, num_cartas=36, tamano_grupo=2):
+        if tamano_grupo != 2:
+            raise ValueError("La solución óptima exacta solo está implementada para parejas")
+        if num_cartas % 2 != 0:
+            raise ValueError(f"{num_cartas} cartas no se pueden repartir en parejas")
+        self.num_cartas = num_cartas
+
+    def costo_esperado(self, cartas_sin_ver=None, sueltas=0):
+        """Movimientos esperados jugando óptimamente desde (cartas_sin_ver, sueltas)"""
+        cartas_sin_ver = self.num_cartas if cartas_sin_ver is None else cartas_sin_ver
+        return filas_optimas(cartas_sin_ver)[0][sueltas]
+
+    def costo_peor_caso(self, cartas_sin_ver=None, sueltas=0):
+        """Movimientos garantizados por la mejor estrategia ante el peor orden de cartas"""
+        cartas_sin_ver = self.num_cartas if cartas_sin_ver is None else cartas_sin_ver
+        return filas_optimas(cartas_sin_ver)[1][sueltas]
+
+    def puntuar(self, movimientos):
+        """Movimientos de un agente relativos al óptimo esperado en turnos (1.0 = óptimo)"""
+        return movimientos / self.costo_esperado()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Costo óptimo exacto del juego de memoria")
+    parser.add_argument("cartas", type=int, nargs="*", default=[36], help="tamaños de tablero")
+    args = parser.parse_args()
+
+    print(f"{'Cartas':>8} | {'Esperado':>10} | {'Peor caso':>9} | {'Tiempo (ms)':>11}")
+    print("-" * 48)
+    for num_cartas in args.cartas:
+        inicio = time.perf_counter()
+        solucionador = SolucionadorOptimo(num_cartas)
+        esperado = solucionador.costo_esperado()
+        peor = solucionador.costo_peor_caso()
+        tiempo = (time.perf_counter() - inicio) * 1000
+        print(f"{num_cartas:>8} | {esperado:>10.3f} | {peor:>9} | {tiempo:>11.2f}")
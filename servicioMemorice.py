@@ -0,0 +1,324 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from loteMemorice import ALGORITMOS, resolver_tablero, validar_tablero
+
+MAX_CUERPO = 16 * 1024 * 1024  # Bytes máximos del cuerpo de una petición
+MAX_LINEA = 64 * 1024  # Bytes máximos de la línea de petición y de cada cabecera
+MENSAJES_HTTP = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                 413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable',
+                 504: 'Gateway Timeout'}
+
+
+class ErrorPeticion(Exception):
+    """Petición inválida: se responde con `estado` y el mensaje como error"""
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+def _resolver_trabajos(trabajos):
+    """
+    Tarea de un proceso trabajador: resuelve un lote de (tablero, algoritmo,
+    tamano_grupo, vencimiento). vencimiento es un instante de time.time(), que
+    se comparte entre procesos; lo que reste del plazo se entrega a la búsqueda.
+    """
+    resultados = []
+    for tablero, algoritmo, tamano_grupo, vencimiento in trabajos:
+        restante = vencimiento - time.time()
+        if restante <= 0:
+            resultados.append({'algoritmo': algoritmo, 'movimientos': None, 'plazo_agotado': True})
+        else:
+            resultados.append(resolver_tablero(tablero, algoritmo, tamano_grupo, plazo=restante))
+    return resultados
+
+
+# ===== SERVICIO HTTP/JSON =====
+class ServicioMemorice:
+    """
+    Servicio asyncio que resuelve tableros enviados por HTTP/JSON
+
+    POST /resolver con {"tablero": [...]} o {"tableros": [[...], ...]} y,
+    opcionalmente, "algoritmo", "tamano_grupo" y "plazo" (segundos). Cada
+    tablero entra a una cola acotada (`max_cola`); si no hay lugar se responde
+    503 de inmediato (contrapresión), y 413 si la petición trae más tableros
+    de los que caben en la cola vacía. Un despachador por trabajador junta
+    hasta `tamano_lote` tableros de la cola (esperando a lo más `espera_lote`
+    segundos) y los resuelve en un ProcessPoolExecutor, sin bloquear el loop.
+    El plazo de cada petición se respeta dentro de cada algoritmo (voraz, A*,
+    IDA*); con "algoritmo": "anytime" se recibe el mejor plan hallado en el plazo.
+    GET /estado devuelve contadores del servicio.
+    """
+    def __init__(self, host='127.0.0.1', puerto=8080, trabajadores=None, max_cola=1000, tamano_lote=16,
+                 espera_lote=0.002, plazo_maximo=30.0):
+        self.host = host
+        self.puerto = puerto
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.max_cola = max_cola
+        self.tamano_lote = tamano_lote
+        self.espera_lote = espera_lote
+        self.plazo_maximo = plazo_maximo  # Plazo por defecto y máximo de cada petición
+        self.cola = None
+        self.pool = None
+        self.servidor = None
+        self.despachadores = []
+        self.resueltos = 0
+        self.rechazados = 0
+        self.lotes = 0
+        self.reinicios_pool = 0
+
+    async def iniciar(self):
+        self.cola = asyncio.Queue(self.max_cola)
+        self.pool = self._crear_pool()
+        self.despachadores = [asyncio.create_task(self._despachar()) for _ in range(self.trabajadores)]
+        self.servidor = await asyncio.start_server(self._atender, self.host, self.puerto, limit=MAX_LINEA)
+        self.puerto = self.servidor.sockets[0].getsockname()[1]  # Por si se pidió el puerto 0
+        return self
+
+    def _crear_pool(self):
+        # 'spawn': un proceso creado con fork heredaría los sockets de las conexiones abiertas
+        return ProcessPoolExecutor(max_workers=self.trabajadores, mp_context=multiprocessing.get_context('spawn'))
+
+    def _reconstruir_pool(self, roto):
+        """
+        Reemplaza un pool roto (un trabajador murió, por ejemplo por falta de
+        memoria): sin esto, cada petición posterior fallaría con BrokenProcessPool.
+        Varios despachadores pueden verlo roto a la vez; solo el primero lo cambia.
+        """
+        if self.pool is roto:
+            roto.shutdown(wait=False, cancel_futures=True)
+            self.pool = self._crear_pool()
+            self.reinicios_pool += 1
+
+    async def detener(self):
+        self.servidor.close()
+        await self.servidor.wait_closed()
+        for despachador in self.despachadores:
+            despachador.cancel()
+        await asyncio.gather(*self.despachadores, return_exceptions=True)
+        self.pool.shutdown(cancel_futures=True)
+
+    async def servir(self):
+        await self.iniciar()
+        async with self.servidor:
+            await self.servidor.serve_forever()
+
+    def estado(self):
+        return {
+            'en_cola': self.cola.qsize(),
+            'max_cola': self.max_cola,
+            'trabajadores': self.trabajadores,
+            'resueltos': self.resueltos,
+            'rechazados': self.rechazados,
+            'lotes': self.lotes,
+            'reinicios_pool': self.reinicios_pool,
+        }
+
+    # --- Cola y lotes ---
+    async def resolver(self, tableros, algoritmo='voraz', tamano_grupo=2, plazo=None):
+        """Encola los tableros y espera sus resultados (en el mismo orden)"""
+        if len(tableros) > self.max_cola:
+            # Nunca cabría en la cola: reintentar no sirve, a diferencia del 503
+            self.rechazados += len(tableros)
+            raise ErrorPeticion(413, f"Una petición admite a lo más {self.max_cola} tableros")
+        if self.cola.qsize() + len(tableros) > self.max_cola:
+            self.rechazados += len(tableros)
+            raise ErrorPeticion(503, "Cola llena, reintentar más tarde")
+        plazo = self.plazo_maximo if plazo is None else min(plazo, self.plazo_maximo)
+        vencimiento = time.time() + plazo
+        loop = asyncio.get_running_loop()
+        futuros = []
+        for tablero in tableros:
+            futuro = loop.create_future()
+            self.cola.put_nowait(((tablero, algoritmo, tamano_grupo, vencimiento), futuro))
+            futuros.append(futuro)
+        return await asyncio.gather(*futuros)
+
+    async def _despachar(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = [await self.cola.get()]
+            if self.espera_lote and self.cola.empty():
+                await asyncio.sleep(self.espera_lote)  # Dar tiempo a que lleguen más tableros
+            while len(lote) < self.tamano_lote and not self.cola.empty():
+                lote.append(self.cola.get_nowait())
+
+            self.lotes += 1
+            trabajos = [trabajo for trabajo, _ in lote]
+            try:
+                try:
+                    pool = self.pool
+                    resultados = await loop.run_in_executor(pool, _resolver_trabajos, trabajos)
+                except BrokenProcessPool:
+                    # Un trabajador murió: se reemplaza el pool y el lote se reintenta una
+                    # vez; si vuelve a romperlo (el lote es el culpable), falla con 500
+                    self._reconstruir_pool(pool)
+                    pool = self.pool
+                    try:
+                        resultados = await loop.run_in_executor(pool, _resolver_trabajos, trabajos)
+                    except BrokenProcessPool:
+                        self._reconstruir_pool(pool)
+                        raise
+            except Exception as error:
+                for _, futuro in lote:
+                    if not futuro.done():
+                        futuro.set_exception(error)
+                continue
+            for (_, futuro), resultado in zip(lote, resultados):
+                if not futuro.done():  # El cliente pudo haberse ido
+                    futuro.set_result(resultado)
+            self.resueltos += len(lote)
+
+    # --- HTTP ---
+    async def _atender(self, lector, escritor):
+        try:
+            while True:
+                try:
+                    peticion = await self._leer_peticion(lector)
+                except ErrorPeticion as error:
+                    await self._responder(escritor, error.estado, {'error': str(error)}, mantener=False)
+                    break
+                if peticion is None:
+                    break
+                metodo, ruta, cabeceras, cuerpo = peticion
+                mantener = cabeceras.get('connection', '').lower() != 'close'
+                try:
+                    estado, datos = await self._procesar(metodo, ruta, cuerpo)
+                except ErrorPeticion as error:
+                    estado, datos = error.estado, {'error': str(error)}
+                except Exception as error:  # Por ejemplo, un proceso trabajador que murió
+                    estado, datos = 500, {'error': f"{type(error).__name__}: {error}"}
+                await self._responder(escritor, estado, datos, mantener)
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            escritor.close()
+
+    async def _leer_linea(self, lector):
+        try:
+            return await lector.readline()
+        except ValueError:  # readline convierte así el LimitOverrunError de una línea sin fin
+            raise ErrorPeticion(400, f"Línea de más de {MAX_LINEA} bytes") from None
+
+    async def _leer_peticion(self, lector):
+        """(metodo, ruta, cabeceras, cuerpo) de la siguiente petición HTTP/1.1, o None si se cerró"""
+        linea = await self._leer_linea(lector)
+        if not linea.strip():
+            return None
+        try:
+            metodo, ruta, _ = linea.decode('latin-1').split()
+        except ValueError:
+            raise ErrorPeticion(400, "Línea de petición inválida") from None
+
+        cabeceras = {}
+        while True:
+            linea = await self._leer_linea(lector)
+            if linea in (b'\r\n', b'\n', b''):
+                break
+            nombre, _, valor = linea.decode('latin-1').partition(':')
+            cabeceras[nombre.strip().lower()] = valor.strip()
+
+        try:
+            largo = int(cabeceras.get('content-length', 0))
+        except ValueError:
+            raise ErrorPeticion(400, "Content-Length inválido") from None
+        if largo < 0:
+            raise ErrorPeticion(400, "Content-Length negativo")
+        if largo > MAX_CUERPO:
+            raise ErrorPeticion(413, f"El cuerpo supera {MAX_CUERPO} bytes")
+        cuerpo = await lector.readexactly(largo) if largo else b''
+        return metodo, ruta, cabeceras, cuerpo
+
+    async def _procesar(self, metodo, ruta, cuerpo):
+        if ruta == '/estado':
+            if metodo != 'GET':
+                raise ErrorPeticion(405, "Usar GET")
+            return 200, self.estado()
+        if ruta != '/resolver':
+            raise ErrorPeticion(404, f"Ruta desconocida: {ruta}")
+        if metodo != 'POST':
+            raise ErrorPeticion(405, "Usar POST")
+
+        try:
+            datos = json.loads(cuerpo or b'{}')
+        except ValueError:
+            raise ErrorPeticion(400, "El cuerpo no es JSON válido") from None
+        if not isinstance(datos, dict):
+            raise ErrorPeticion(400, "Se espera un objeto JSON")
+        algoritmo = datos.get('algoritmo', 'voraz')
+        if algoritmo not in ALGORITMOS:
+            raise ErrorPeticion(400, f"Algoritmo desconocido: {algoritmo}")
+        tamano_grupo = datos.get('tamano_grupo', 2)
+        # bool es subclase de int: true/false no son tamaños de grupo
+        if not isinstance(tamano_grupo, int) or isinstance(tamano_grupo, bool) or tamano_grupo < 2:
+            raise ErrorPeticion(400, "tamano_grupo debe ser un entero mayor o igual a 2")
+        plazo = datos.get('plazo')
+        if plazo is not None and (not isinstance(plazo, (int, float)) or isinstance(plazo, bool) or plazo <= 0):
+            raise ErrorPeticion(400, "plazo debe ser un número positivo de segundos")
+        tableros = datos['tableros'] if 'tableros' in datos else [datos.get('tablero')]
+        if not isinstance(tableros, list) or not tableros:
+            raise ErrorPeticion(400, "Falta 'tablero' o 'tableros'")
+        for tablero in tableros:
+            try:
+                validar_tablero(tablero, tamano_grupo)
+            except ValueError as error:
+                raise ErrorPeticion(400, str(error)) from None
+
+        resultados = await self.resolver(tableros, algoritmo, tamano_grupo, plazo)
+        # Si ningún tablero alcanzó a resolverse en el plazo, la petición completa venció
+        estado = 504 if all(resultado['movimientos'] is None for resultado in resultados) else 200
+        return estado, {'resultados': resultados}
+
+    async def _responder(self, escritor, estado, datos, mantener):
+        cuerpo = json.dumps(datos).encode()
+        cabeceras = [
+            f"HTTP/1.1 {estado} {MENSAJES_HTTP[estado]}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(cuerpo)}",
+            f"Connection: {'keep-alive' if mantener else 'close'}",
+        ]
+        if estado == 503:
+            cabeceras.append("Retry-After: 1")
+        escritor.write(("\r\n".join(cabeceras) + "\r\n\r\n").encode('latin-1') + cuerpo)
+        await escritor.drain()
+
+
+async def solicitar(host, puerto, metodo, ruta, datos=None):
+    """Cliente mínimo para probar el servicio en local: devuelve (estado HTTP, JSON)"""
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    cuerpo = json.dumps(datos).encode() if datos is not None else b''
+    escritor.write(f"{metodo} {ruta} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n"
+                   f"Content-Length: {len(cuerpo)}\r\n\r\n".encode('latin-1') + cuerpo)
+    await escritor.drain()
+    respuesta = await lector.read()
+    escritor.close()
+    encabezado, _, contenido = respuesta.partition(b'\r\n\r\n')
+    return int(encabezado.split()[1]), json.loads(contenido)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servicio HTTP/JSON para resolver tableros")
+    parser.add_argument("--host", default='127.0.0.1')
+    parser.add_argument("--puerto", type=int, default=8080)
+    parser.add_argument("--trabajadores", type=int, default=None, help="procesos (por defecto, uno por núcleo)")
+    parser.add_argument("--max-cola", type=int, default=1000, help="tableros en espera antes de responder 503")
+    parser.add_argument("--lote", type=int, default=16, help="tableros máximos por tarea enviada a un proceso")
+    parser.add_argument("--espera-lote", type=float, default=0.002, help="segundos que se espera para juntar un lote")
+    parser.add_argument("--plazo-maximo", type=float, default=30.0, help="plazo por defecto y máximo por petición")
+    args = parser.parse_args()
+
+    servicio = ServicioMemorice(args.host, args.puerto, args.trabajadores, args.max_cola, args.lote,
+                                args.espera_lote, args.plazo_maximo)
+    print(f"Sirviendo en http://{args.host}:{args.puerto} (POST /resolver, GET /estado)")
+    try:
+        asyncio.run(servicio.servir())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,12 @@
+import pytest
+
+from benchmarkMemorice import verificar_heuristica
+
+
+# Tableros chicos: la solución exhaustiva recorre todos los estados alcanzables
+@pytest.mark.parametrize("tamano_grupo, num_cartas", [(2, 8), (3, 9)])
+@pytest.mark.parametrize("limite_ramificacion", [None, 6])
+def test_heuristica_admisible_y_consistente(tamano_grupo, num_cartas, limite_ramificacion):
+    revisados, violaciones = verificar_heuristica(20, num_cartas, tamano_grupo, 0, limite_ramificacion)
+    assert revisados > 0
+    assert violaciones == []
@@ -0,0 +1,121 @@
+import argparse
+import time
+
+import numpy as np
+
+from agenteMemorice import AgenteMemorice
+
+
+def generar_tableros(num_tableros, num_cartas=36, tamano_grupo=2, semilla=None):
+    """Matriz (num_tableros x num_cartas) de tableros aleatorios, como generar_tablero pero en lote"""
+    if num_cartas % tamano_grupo != 0:
+        raise ValueError(f"{num_cartas} cartas no se pueden repartir en grupos de {tamano_grupo}")
+    base = np.repeat(np.arange(1, num_cartas // tamano_grupo + 1, dtype=np.int32), tamano_grupo)
+    return np.random.default_rng(semilla).permuted(np.tile(base, (num_tableros, 1)), axis=1)
+
+
+# ===== ALGORITMO VORAZ VECTORIZADO =====
+class AgenteMemoriceVectorizado:
+    """
+    Algoritmo voraz de AgenteMemorice para muchos tableros a la vez con NumPy
+
+    Recibe una matriz (N_tableros x N_cartas) y avanza todos los tableros en
+    paralelo, un turno por iteración: si un tablero conoce un grupo completo lo
+    empareja, si no revela las siguientes tamano_grupo cartas. Solo se lleva la
+    cuenta de cartas vistas por valor y de grupos listos por tablero: el orden
+    en que se emparejan los grupos listos no cambia el total de movimientos, así
+    que el resultado coincide exactamente con AgenteMemorice.
+    Los tableros se procesan en bloques de `tamano_bloque` para acotar la memoria.
+    """
+    def __init__(self, tableros, tamano_grupo=2, tamano_bloque=65536):
+        self.tableros = np.asarray(tableros)
+        if self.tableros.ndim != 2:
+            raise ValueError("Se espera una matriz (N_tableros x N_cartas)")
+        self.tamano_grupo = tamano_grupo
+        self.tamano_bloque = tamano_bloque
+        self.movimientos = None  # Arreglo con los movimientos de cada tablero, tras resolver()
+
+    def _codificar(self, bloque):
+        """Valores -> códigos 0..V-1 y verificación de que cada valor forma grupos exactos"""
+        valores, codigos = np.unique(bloque, return_inverse=True)
+        codigos = codigos.reshape(bloque.shape).astype(np.int32)
+
+        # Con cada fila ordenada, cada valor debe ocupar exactamente tamano_grupo casillas seguidas
+        k = self.tamano_grupo
+        ordenados = np.sort(codigos, axis=1)
+        grupos = ordenados.reshape(len(bloque), -1, k)
+        if not (np.all(grupos == grupos[:, :, :1]) and np.all(np.diff(grupos[:, :, 0], axis=1) > 0)):
+            raise ValueError(f"Cada valor debe aparecer exactamente {k} veces en cada tablero")
+        return codigos, len(valores)
+
+    def _resolver_bloque(self, bloque):
+        num_tableros, num_cartas = bloque.shape
+        k = self.tamano_grupo
+        codigos, num_valores = self._codificar(bloque)
+
+        vistas_por_valor = np.zeros((num_tableros, num_valores), dtype=np.int16)
+        listas = np.zeros(num_tableros, dtype=np.int32)  # Grupos completos conocidos sin emparejar
+        cursor = np.zeros(num_tableros, dtype=np.int64)  # Siguiente posición a explorar
+        emparejadas = np.zeros(num_tableros, dtype=np.int64)
+        movimientos = np.zeros(num_tableros, dtype=np.int64)
+
+        activos = np.arange(num_tableros)
+        while len(activos):
+            conoce_pareja = listas[activos] > 0
+
+            # 1. Tableros con un grupo conocido: emparejarlo
+            emparejan = activos[conoce_pareja]
+            listas[emparejan] -= 1
+            emparejadas[emparejan] += k
+
+            # 2. El resto explora las siguientes k cartas (menos si se acaba el tablero)
+            exploran = activos[~conoce_pareja]
+            for desplazamiento in range(k):
+                posiciones = cursor[exploran] + desplazamiento
+                validas = posiciones < num_cartas
+                filas = exploran[validas]
+                valores = codigos[filas, posiciones[validas]]
+                vistas_por_valor[filas, valores] += 1  # Cada fila aparece una sola vez: sin colisiones
+                completos = vistas_por_valor[filas, valores] == k
+                listas[filas[completos]] += 1
+            cursor[exploran] = np.minimum(cursor[exploran] + k, num_cartas)
+
+            movimientos[activos] += 1
+            activos = activos[emparejadas[activos] < num_cartas]
+
+        return movimientos
+
+    def resolver(self):
+        """Resuelve todos los tableros y devuelve el arreglo de movimientos por tablero"""
+        resultados = [self._resolver_bloque(self.tableros[inicio:inicio + self.tamano_bloque])
+                      for inicio in range(0, len(self.tableros), self.tamano_bloque)]
+        self.movimientos = np.concatenate(resultados) if resultados else np.zeros(0, dtype=np.int64)
+        return self.movimientos
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Algoritmo voraz vectorizado con NumPy (Monte Carlo)")
+    parser.add_argument("--tableros", type=int, default=1_000_000, help="cantidad de tableros aleatorios")
+    parser.add_argument("--cartas", type=int, default=36, help="cartas por tablero")
+    parser.add_argument("--grupo", type=int, default=2, help="cartas iguales por grupo (2 = parejas)")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--verificar", type=int, default=100,
+                        help="tableros a comparar contra AgenteMemorice (0 = no verificar)")
+    args = parser.parse_args()
+
+    tableros = generar_tableros(args.tableros, args.cartas, args.grupo, args.semilla)
+    inicio = time.perf_counter()
+    movimientos = AgenteMemoriceVectorizado(tableros, args.grupo).resolver()
+    tiempo = time.perf_counter() - inicio
+
+    print(f"Tableros resueltos: {len(movimientos)} en {tiempo:.3f} segundos "
+          f"({len(movimientos) / tiempo * 60:,.0f} tableros/minuto)")
+    print(f"Movimientos: promedio {movimientos.mean():.2f}, mínimo {movimientos.min()}, máximo {movimientos.max()}")
+
+    for fila in range(min(args.verificar, len(tableros))):
+        agente = AgenteMemorice(tableros[fila].tolist(), args.grupo, verboso=False)
+        agente.resolver()
+        if agente.movimientos != movimientos[fila]:
+            raise SystemExit(f"Diferencia en el tablero {fila}: {agente.movimientos} vs {movimientos[fila]}")
+    if args.verificar:
+        print(f"Verificado contra AgenteMemorice en {min(args.verificar, len(tableros))} tableros")